@@ -2,10 +2,21 @@
 Application configuration using Pydantic settings
 """
 
-from functools import lru_cache
-from typing import Optional
+import os
+from functools import cached_property
+from typing import Literal, Optional, Type
+from urllib.parse import urlparse
 
+from pydantic import field_validator
 from pydantic_settings import BaseSettings
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, StaticPool
+
+
+def _env_file() -> Optional[str]:
+    """Dotenv file to load, or None in production where env vars are injected"""
+    if os.getenv("ENVIRONMENT", "").lower() == "production":
+        return None
+    return ".env"
 
 
 class Settings(BaseSettings):
@@ -14,7 +25,9 @@ class Settings(BaseSettings):
     # Application
     app_name: str = "GymIntel API"
     version: str = "1.0.0"
-    environment: str = "development"
+    environment: Literal["development", "staging", "production", "testing"] = (
+        "development"
+    )
     debug: bool = False
 
     # Database
@@ -25,6 +38,11 @@ class Settings(BaseSettings):
     database_password: str = "gymintel_dev"
     database_url: Optional[str] = None
 
+    # Connection pool
+    database_pool_size: int = 20
+    database_max_overflow: int = 10
+    database_pool_recycle: int = 1800  # seconds
+
     # Test Database
     test_database_host: str = "localhost"
     test_database_port: int = 5432
@@ -50,9 +68,14 @@ class Settings(BaseSettings):
     # Redis (optional)
     redis_url: Optional[str] = None
 
-    model_config = {"env_file": ".env", "case_sensitive": False}
+    # Frozen: settings are read-only after startup
+    model_config = {
+        "env_file": _env_file(),
+        "case_sensitive": False,
+        "frozen": True,
+    }
 
-    @property
+    @cached_property
     def async_database_url(self) -> str:
         """Get async database URL, building from components if needed"""
         if self.database_url:
@@ -69,7 +92,7 @@ class Settings(BaseSettings):
             f"@{self.database_host}:{self.database_port}/{self.database_name}"
         )
 
-    @property
+    @cached_property
     def async_test_database_url(self) -> str:
         """Get async test database URL, building from components if needed"""
         if self.test_database_url:
@@ -88,22 +111,34 @@ class Settings(BaseSettings):
             f"/{self.test_database_name}"
         )
 
-    @property
+    @cached_property
+    def pool_class(self) -> Type[Pool]:
+        """Connection pool class matching the database driver"""
+        if urlparse(self.async_database_url).scheme.startswith("sqlite"):
+            return StaticPool
+        return AsyncAdaptedQueuePool
+
+    @field_validator("environment", mode="before")
+    @classmethod
+    def _normalize_environment(cls, value):
+        """Accept ENVIRONMENT in any case, e.g. Production"""
+        return value.strip().lower() if isinstance(value, str) else value
+
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production"""
-        return self.environment.lower() == "production"
+        return self.environment == "production"
 
-    @property
+    @cached_property
     def is_testing(self) -> bool:
         """Check if running tests"""
-        return self.environment.lower() == "testing"
+        return self.environment == "testing"
 
 
-@lru_cache()
-def get_settings() -> Settings:
-    """Get cached settings instance"""
-    return Settings()
+# Singleton instance; import this directly rather than calling get_settings()
+settings = Settings()
 
 
-# Create a singleton instance
-settings = get_settings()
+def get_settings() -> Settings:
+    """Get the settings singleton (deprecated: import ``settings`` instead)"""
+    return settings
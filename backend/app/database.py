@@ -3,60 +3,102 @@ Database configuration and session management
 """
 
 from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Dict
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import QueuePool, StaticPool
 
-from .config import get_settings
+from .config import settings
 from .models.gym import Base
 
-# Get settings
-settings = get_settings()
 
-# Get async database URL from settings
-ASYNC_DATABASE_URL = settings.async_database_url
+@lru_cache(maxsize=1)
+def get_engine() -> AsyncEngine:
+    """Get the process-wide async engine, creating it on first use.
+
+    Engine creation is deferred so that importing this module (alembic,
+    pytest collection, CLI scripts) does not set up a connection pool.
+    """
+    database_url = settings.async_database_url
+    pool_class = settings.pool_class
+    if pool_class is StaticPool:
+        return create_async_engine(database_url, echo=False, poolclass=pool_class)
+
+    return create_async_engine(
+        database_url,
+        echo=False,  # Set to True for SQL debugging
+        poolclass=pool_class,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_recycle=settings.database_pool_recycle,
+        # LIFO keeps a small set of connections hot; idle extras age out
+        pool_use_lifo=True,
+        # Pre-ping costs a round trip per checkout, so only pay it in debug;
+        # pool_recycle already retires connections before servers drop them
+        pool_pre_ping=settings.debug,
+    )
+
+
+def pool_stats() -> Dict[str, int]:
+    """Connection pool usage for monitoring; empty until the engine exists"""
+    if get_engine.cache_info().currsize == 0:
+        return {}
+
+    pool = get_engine().pool
+    if not isinstance(pool, QueuePool):
+        return {}
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+    }
 
-# Create async engine
-engine = create_async_engine(
-    ASYNC_DATABASE_URL,
-    echo=False,  # Set to True for SQL debugging
-    pool_pre_ping=True,
-    poolclass=StaticPool if "sqlite" in ASYNC_DATABASE_URL else None,
-)
 
-# Create async session factory
-AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+@lru_cache(maxsize=1)
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Get the session factory bound to the shared engine"""
+    return async_sessionmaker(get_engine(), expire_on_commit=False)
 
 
 @asynccontextmanager
 async def get_db_session():
     """Get database session with automatic cleanup"""
-    async with AsyncSessionLocal() as session:
+    async with get_session_factory()() as session:
         try:
             yield session
             await session.commit()
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
 
 
 async def create_tables():
     """Create all database tables"""
-    async with engine.begin() as conn:
+    async with get_engine().begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
 
 async def drop_tables():
     """Drop all database tables (for testing)"""
-    async with engine.begin() as conn:
+    async with get_engine().begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
 
 # FastAPI dependency
 async def get_db():
     """Dependency for FastAPI routes"""
-    async with get_db_session() as session:
-        yield session
+    # Session lifecycle is inlined rather than delegating to get_db_session()
+    # so each request runs through a single generator frame
+    async with get_session_factory()() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
@@ -11,95 +11,123 @@ import logging
 from urllib.parse import urlparse
 
 from app.config import settings
-from app.database import Base, engine
+from app.database import Base, get_engine
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import create_async_engine
 
 logger = logging.getLogger(__name__)
 
+# SQLSTATE raised when connecting to a database that does not exist
+INVALID_CATALOG_NAME = "3D000"
+
+CREATE_POSTGIS_SQL = text("CREATE EXTENSION IF NOT EXISTS postgis")
+
+# create_all only adds indexes along with new tables, so databases created
+# before these gym indexes were declared get them added separately
+CREATE_GYM_INDEX_SQL = (
+    text(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_gyms_name_address "
+        "ON gyms (name, address)"
+    ),
+    text(
+        "CREATE INDEX IF NOT EXISTS ix_gyms_location_geography "
+        "ON gyms USING gist ((location::geography))"
+    ),
+)
+
+
+def _is_missing_database(error: Exception) -> bool:
+    """Check whether a connection error means the target database is missing."""
+    orig = getattr(error, "orig", None) or error
+    sqlstate = getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+    return sqlstate == INVALID_CATALOG_NAME
+
 
 async def ensure_postgis_extension():
     """Ensure PostGIS extension is installed in PostgreSQL."""
-    if not settings.async_database_url.startswith("postgresql"):
+    database_url = settings.async_database_url
+    parsed = urlparse(database_url)
+    if not parsed.scheme.startswith("postgresql"):
         logger.info("Not using PostgreSQL, skipping PostGIS check")
         return
 
+    db_name = parsed.path.lstrip("/")
+
     try:
-        # Parse the database URL for more robust handling
-        parsed = urlparse(settings.async_database_url)
-        db_name = parsed.path.lstrip("/")
-
-        # Create postgres database URL by replacing the database name
-        postgres_url = settings.async_database_url.replace(f"/{db_name}", "/postgres")
-
-        # Ensure we're using asyncpg driver
-        if "asyncpg" not in postgres_url:
-            postgres_url = postgres_url.replace(
-                "postgresql://", "postgresql+asyncpg://"
-            )
-
-        postgres_engine = create_async_engine(postgres_url, echo=False)
-
-        async with postgres_engine.connect() as conn:
-            # First ensure the database exists - use parameterized query to
-            # avoid SQL injection
-            result = await conn.execute(
-                text("SELECT 1 FROM pg_database WHERE datname = :db_name"),
-                {"db_name": db_name},
-            )
-            if not result.scalar():
-                logger.error(f"Database '{db_name}' does not exist")
-                await postgres_engine.dispose()
-                return
-
-        # Clean up the postgres engine
-        await postgres_engine.dispose()
-
-        # Now connect to our actual database
-        async with engine.connect() as conn:
-            # Check if PostGIS is already installed
-            result = await conn.execute(
-                text("SELECT 1 FROM pg_extension WHERE extname = 'postgis'")
-            )
-            if result.scalar():
-                logger.info("PostGIS extension already installed")
-            else:
-                # Try to create PostGIS extension
-                try:
-                    await conn.execute(text("CREATE EXTENSION IF NOT EXISTS postgis"))
-                    await conn.commit()
-                    logger.info("PostGIS extension installed successfully")
-                except Exception as e:
-                    logger.warning(f"Could not create PostGIS extension: {e}")
-                    logger.warning(
-                        "You may need to install it manually with superuser privileges"
-                    )
+        # CREATE EXTENSION IF NOT EXISTS is a no-op when PostGIS is already
+        # installed, so there is no separate pg_database / pg_extension check:
+        # a missing database surfaces as a connection error instead.
+        async with get_engine().connect() as conn:
+            try:
+                await conn.execute(CREATE_POSTGIS_SQL)
+                await conn.commit()
+                logger.info("PostGIS extension is installed")
+            except Exception as e:
+                logger.warning(f"Could not create PostGIS extension: {e}")
+                logger.warning(
+                    "You may need to install it manually with superuser privileges"
+                )
 
     except Exception as e:
+        if _is_missing_database(e):
+            logger.error(f"Database '{db_name}' does not exist")
+            return
         logger.error(f"Error checking/installing PostGIS: {e}")
 
 
-async def create_tables():
-    """Create all database tables from SQLAlchemy models."""
+async def create_tables(fresh: bool = False):
+    """Create all database tables from SQLAlchemy models.
+
+    Args:
+        fresh: The database is known to be empty, so skip the per-table
+            existence check (one round trip per table)
+    """
     try:
-        async with engine.begin() as conn:
+        async with get_engine().begin() as conn:
             # Create all tables
-            await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(Base.metadata.create_all, checkfirst=not fresh)
             logger.info("All database tables created successfully")
     except Exception as e:
         logger.error(f"Error creating tables: {e}")
         raise
 
 
-async def init_database():
-    """Initialize the database with all required components."""
+async def ensure_gym_indexes():
+    """Ensure gym indexes declared after the table was created exist.
+
+    Raises if an index cannot be built. Gym imports upsert on the unique
+    (name, address) index, so they would fail without it.
+    """
+    for statement in CREATE_GYM_INDEX_SQL:
+        try:
+            async with get_engine().begin() as conn:
+                await conn.execute(statement)
+        except Exception as e:
+            logger.error(f"Could not create gym index: {e}")
+            if "uq_gyms_name_address" in statement.text:
+                logger.error(
+                    "Run 'alembic upgrade head' to merge duplicate gyms "
+                    "by name and address"
+                )
+            raise
+    logger.info("Gym indexes are in place")
+
+
+async def init_database(fresh: bool = False):
+    """Initialize the database with all required components.
+
+    Args:
+        fresh: The database has no tables yet (see create_tables)
+    """
     logger.info("Starting database initialization...")
 
     # Ensure PostGIS is installed (for PostgreSQL)
     await ensure_postgis_extension()
 
     # Create tables
-    await create_tables()
+    await create_tables(fresh=fresh)
+
+    if not fresh:
+        await ensure_gym_indexes()
 
     logger.info("Database initialization completed")
 
@@ -0,0 +1,71 @@
+"""
+Schema extensions that skip repeated work for identical operations
+"""
+
+from collections import OrderedDict
+from typing import Iterator, Optional, Tuple
+
+from graphql import FieldNode
+from graphql.utilities import get_operation_ast
+from strawberry.extensions import SchemaExtension
+from strawberry.types import ExecutionContext
+
+# Distinct introspection documents kept; clients send only a handful
+INTROSPECTION_CACHE_SIZE = 32
+
+
+def _introspection_cache_key(
+    execution_context: ExecutionContext,
+) -> Optional[Tuple[str, Optional[str]]]:
+    """Key for operations that only select meta fields, else None
+
+    Introspection output depends on nothing but the schema, which is fixed for
+    the life of the process. Operations with variables or top-level fragment
+    spreads are not cached.
+    """
+    if execution_context.variables or execution_context.graphql_document is None:
+        return None
+
+    operation = get_operation_ast(
+        execution_context.graphql_document, execution_context.operation_name
+    )
+    if operation is None:
+        return None
+
+    for selection in operation.selection_set.selections:
+        if not (
+            isinstance(selection, FieldNode) and selection.name.value.startswith("__")
+        ):
+            return None
+
+    return execution_context.query, execution_context.operation_name
+
+
+class IntrospectionCache(SchemaExtension):
+    """Serve repeated introspection queries from the previous result"""
+
+    _results: "OrderedDict[Tuple[str, Optional[str]], object]" = OrderedDict()
+
+    def on_execute(self) -> Iterator[None]:
+        execution_context = self.execution_context
+        key = _introspection_cache_key(execution_context)
+        if key is None:
+            yield
+            return
+
+        results = IntrospectionCache._results
+        cached = results.get(key)
+        if cached is not None:
+            results.move_to_end(key)
+            # A result already set makes strawberry skip execution
+            execution_context.result = cached
+            yield
+            return
+
+        yield
+
+        result = execution_context.result
+        if result is not None and not result.errors:
+            results[key] = result
+            if len(results) > INTROSPECTION_CACHE_SIZE:
+                results.popitem(last=False)
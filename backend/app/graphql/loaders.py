@@ -0,0 +1,62 @@
+"""
+Per-request DataLoaders for batching nested Gym lookups
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, List
+
+from sqlalchemy import select
+from strawberry.dataloader import DataLoader
+
+from ..database import get_db_session
+from ..models.gym import DataSource, Review
+from .schema import DataSource as DataSourceType
+from .schema import Review as ReviewType
+
+
+async def load_sources_by_gym(gym_ids: List[str]) -> List[List[DataSourceType]]:
+    """Fetch data sources for many gyms in one query"""
+    sources_by_gym: Dict[str, List[DataSourceType]] = defaultdict(list)
+
+    async with get_db_session() as session:
+        result = await session.execute(
+            select(DataSource).where(DataSource.gym_id.in_(gym_ids))
+        )
+        for source in result.scalars():
+            sources_by_gym[str(source.gym_id)].append(
+                DataSourceType(
+                    name=source.name,
+                    confidence=source.confidence,
+                    last_updated=source.last_updated,
+                )
+            )
+
+    return [sources_by_gym.get(gym_id, []) for gym_id in gym_ids]
+
+
+async def load_reviews_by_gym(gym_ids: List[str]) -> List[List[ReviewType]]:
+    """Fetch reviews for many gyms in one query"""
+    reviews_by_gym: Dict[str, List[ReviewType]] = defaultdict(list)
+
+    async with get_db_session() as session:
+        result = await session.execute(select(Review).where(Review.gym_id.in_(gym_ids)))
+        for review in result.scalars():
+            reviews_by_gym[str(review.gym_id)].append(
+                ReviewType(
+                    rating=review.rating,
+                    review_count=review.review_count,
+                    sentiment_score=review.sentiment_score,
+                    source=review.source,
+                    last_updated=review.last_updated,
+                )
+            )
+
+    return [reviews_by_gym.get(gym_id, []) for gym_id in gym_ids]
+
+
+def create_loaders() -> Dict[str, Any]:
+    """Create a fresh set of loaders; call once per request"""
+    return {
+        "sources_loader": DataLoader(load_fn=load_sources_by_gym),
+        "reviews_loader": DataLoader(load_fn=load_reviews_by_gym),
+    }
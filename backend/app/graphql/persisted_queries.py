@@ -0,0 +1,133 @@
+"""
+Automatic persisted queries (Apollo APQ) for the GraphQL HTTP endpoint
+
+Clients send the sha256 of a document instead of its text. The first time a
+hash is seen the server answers PersistedQueryNotFound and the client resends
+it with the full text, which is then stored. Parsing and validation of the
+stored text are cached by the schema's ParserCache/ValidationCache.
+
+The router also encodes responses with orjson when it is installed.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Union
+
+from graphql import GraphQLError
+from strawberry.fastapi import GraphQLRouter
+from strawberry.http import GraphQLHTTPResponse, GraphQLRequestData
+from strawberry.http.exceptions import HTTPException
+from strawberry.types import ExecutionResult
+
+# orjson is optional; responses fall back to the stdlib encoder
+try:
+    import orjson
+
+    def _encode_response(response_data: GraphQLHTTPResponse) -> bytes:
+        return orjson.dumps(response_data)
+
+except ImportError:
+    import json
+
+    def _encode_response(response_data: GraphQLHTTPResponse) -> str:
+        return json.dumps(response_data)
+
+
+# Distinct documents remembered; the frontend ships a few dozen
+PERSISTED_QUERY_CACHE_SIZE = 4096
+
+PERSISTED_QUERY_NOT_FOUND = "PersistedQueryNotFound"
+
+
+class PersistedQueryNotFound(Exception):
+    """The client sent only a hash this server has not stored"""
+
+
+class PersistedQueryStore:
+    """Query text by sha256 hash, in LRU order"""
+
+    def __init__(self, maxsize: int = PERSISTED_QUERY_CACHE_SIZE):
+        self._queries: "OrderedDict[str, str]" = OrderedDict()
+        self._maxsize = maxsize
+
+    def resolve(self, query: Optional[str], extensions: Dict[str, Any]) -> str:
+        """Return the query text for a request, storing newly sent documents
+
+        Raises PersistedQueryNotFound for an unknown hash without text and
+        HTTPException for a malformed persistedQuery extension.
+        """
+        persisted = extensions.get("persistedQuery")
+        if not isinstance(persisted, dict):
+            return query
+
+        sha256_hash = persisted.get("sha256Hash")
+        if persisted.get("version") != 1 or not isinstance(sha256_hash, str):
+            raise HTTPException(400, "Unsupported persistedQuery extension")
+
+        if query is None:
+            query = self._queries.get(sha256_hash)
+            if query is None:
+                raise PersistedQueryNotFound()
+            self._queries.move_to_end(sha256_hash)
+            return query
+
+        if hashlib.sha256(query.encode()).hexdigest() != sha256_hash:
+            raise HTTPException(400, "provided sha does not match query")
+
+        self._queries[sha256_hash] = query
+        self._queries.move_to_end(sha256_hash)
+        if len(self._queries) > self._maxsize:
+            self._queries.popitem(last=False)
+        return query
+
+
+class PersistedQueryRouter(GraphQLRouter):
+    """GraphQLRouter that accepts Apollo persisted query hashes"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.persisted_queries = PersistedQueryStore()
+
+    async def parse_http_body(self, request) -> GraphQLRequestData:
+        content_type = request.content_type or ""
+
+        if "application/json" in content_type:
+            data = self.parse_json(await request.get_body())
+            extensions = data.get("extensions") or {}
+        elif request.method == "GET" and not content_type.startswith(
+            "multipart/form-data"
+        ):
+            data = self.parse_query_params(request.query_params)
+            extensions = data.get("extensions") or {}
+            if isinstance(extensions, str):
+                extensions = self.parse_json(extensions)
+        else:
+            return await super().parse_http_body(request)
+
+        if not isinstance(extensions, dict):
+            raise HTTPException(400, "extensions must be an object")
+
+        return GraphQLRequestData(
+            query=self.persisted_queries.resolve(data.get("query"), extensions),
+            variables=data.get("variables"),
+            operation_name=data.get("operationName"),
+        )
+
+    def encode_json(self, response_data: GraphQLHTTPResponse) -> Union[str, bytes]:
+        # Starlette sends bytes as they are, skipping a decode/encode round trip
+        return _encode_response(response_data)
+
+    async def execute_operation(self, request, context, root_value):
+        try:
+            return await super().execute_operation(request, context, root_value)
+        except PersistedQueryNotFound:
+            # Apollo clients recognise this error and retry with the full text
+            return ExecutionResult(
+                data=None,
+                errors=[
+                    GraphQLError(
+                        PERSISTED_QUERY_NOT_FOUND,
+                        extensions={"code": "PERSISTED_QUERY_NOT_FOUND"},
+                    )
+                ],
+            )
@@ -2,25 +2,197 @@
 GraphQL Resolvers Implementation
 """
 
-import json
+import asyncio
+import base64
+import logging
+import time
+import uuid
+from contextlib import suppress
 from datetime import datetime
-from typing import List, Optional
-
-from sqlalchemy import and_, select
-from sqlalchemy.orm import selectinload
+from functools import lru_cache
+from operator import attrgetter
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import (
+    bindparam,
+    exists,
+    func,
+    insert,
+    literal_column,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import defer, raiseload
 
 from ..database import get_db_session
-from ..models.gym import DataSource, Gym
+from ..models.gym import (
+    GOOGLE_PLACES_SOURCE,
+    YELP_SOURCE,
+    DataSource,
+    Gym,
+    uuid7,
+)
 from ..services.city_boundaries import CityBoundaryService
 from ..services.cli_bridge import cli_bridge_service
 from ..services.geocoding import geocoding_service
 from ..services.search_progress import search_progress_manager
-from .schema import Coordinates
-from .schema import DataSource as DataSourceType
+from .schema import (
+    Coordinates,
+)
 from .schema import Gym as GymType
-from .schema import GymAnalytics, ImportResult, MarketGap, MetropolitanArea
-from .schema import Review as ReviewType
-from .schema import SearchFilters, SearchResult
+from .schema import (
+    GymAnalytics,
+    GymConnection,
+    GymEdge,
+    ImportResult,
+    MarketGap,
+    MetropolitanArea,
+    MetroStatistics,
+    PageInfo,
+    SearchFilters,
+    SearchResult,
+)
+
+# orjson is optional; analytics payloads fall back to the stdlib encoder
+try:
+    import orjson
+
+    def _to_json(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    import json
+
+    def _to_json(obj) -> str:
+        return json.dumps(obj)
+
+
+logger = logging.getLogger(__name__)
+
+# How long the metro area catalogue from the CLI is reused before reloading
+METRO_CACHE_TTL_SECONDS = 300
+
+# SearchResult fields computed by GymResolvers._search_stats
+SEARCH_STATS_FIELDS = frozenset(
+    {"yelpResults", "googleResults", "mergedCount", "avgConfidence"}
+)
+EMPTY_SEARCH_STATS = SimpleNamespace(
+    yelp_results=0, google_results=0, merged_count=0, avg_confidence=0.0
+)
+
+# Result sets larger than this are converted to GraphQL types in a worker
+# thread so a big response does not stall other requests on the event loop
+THREADED_CONVERSION_THRESHOLD = 64
+
+# Largest gymsByMetro page; bounds the per-request conversion work now that
+# clients can page through a metro with cursors
+MAX_METRO_PAGE_SIZE = 500
+
+# Loader options for gyms that are only converted to GraphQL types. Sources
+# and reviews come via DataLoader, so any relationship load is a bug and
+# fails loudly; the geometry and raw API payload are never exposed, so they
+# are left out of the SELECT
+GYM_READ_OPTIONS = (
+    raiseload("*"),
+    defer(Gym.location, raiseload=True),
+    defer(Gym.raw_data, raiseload=True),
+)
+
+# Gyms by id, kept in the order the city boundary service ranked them
+GYMS_BY_RANKED_IDS = (
+    select(Gym)
+    .options(*GYM_READ_OPTIONS)
+    .where(Gym.id.in_(bindparam("gym_ids", expanding=True)))
+    .order_by(
+        func.array_position(
+            bindparam("ranked_gym_ids", type_=ARRAY(UUID(as_uuid=True))), Gym.id
+        )
+    )
+)
+
+# Columns refreshed when an imported gym is already stored under the same
+# (name, address); everything else keeps its first-seen value
+GYM_UPSERT_REFRESH = ("confidence", "rating", "review_count", "updated_at")
+
+# Rows per upsert statement; each row binds about twenty parameters and a
+# PostgreSQL statement is capped at 32767
+GYM_UPSERT_BATCH_SIZE = 1000
+
+# Reads every column _gym_to_graphql needs in one C-level call instead of
+# sixteen instrumented attribute lookups
+_gym_columns = attrgetter(
+    "id",
+    "name",
+    "address",
+    "latitude",
+    "longitude",
+    "phone",
+    "website",
+    "instagram",
+    "confidence",
+    "match_confidence",
+    "rating",
+    "review_count",
+    "source_city",
+    "metropolitan_area_code",
+    "created_at",
+    "updated_at",
+)
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso_timestamp(value: str) -> datetime:
+    """Parse a CLI ISO-8601 timestamp; sources in one batch share a few values"""
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+def _dedupe_cli_gyms(gyms_data: List[dict]) -> List[dict]:
+    """Collapse gyms sharing a (name, address) into the most confident
+    record, keeping the sources of every duplicate (one per source name)
+
+    The first record wins ties. Records without "sources" are returned
+    without one, so gym rows can be deduplicated before an upsert.
+    """
+    unique: Dict[tuple, dict] = {}
+    for gym_data in gyms_data:
+        key = (gym_data["name"], gym_data["address"])
+        current = unique.get(key)
+        if current is None:
+            unique[key] = gym_data
+            continue
+
+        if gym_data["confidence"] > current["confidence"]:
+            best, other = gym_data, current
+        else:
+            best, other = current, gym_data
+        if "sources" in best or "sources" in other:
+            sources = {source["name"]: source for source in other.get("sources", [])}
+            sources.update(
+                (source["name"], source) for source in best.get("sources", [])
+            )
+            best = dict(best, sources=list(sources.values()))
+        unique[key] = best
+    return list(unique.values())
+
+
+def _encode_gym_cursor(gym: Gym) -> str:
+    """Opaque keyset cursor for a gym's (created_at, id) position"""
+    raw = f"{gym.created_at.isoformat()}|{gym.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_gym_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """Inverse of _encode_gym_cursor"""
+    try:
+        created_at, gym_id = base64.urlsafe_b64decode(cursor).decode().split("|")
+        return datetime.fromisoformat(created_at), uuid.UUID(gym_id)
+    except ValueError as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
 
 
 class GymResolvers:
@@ -32,11 +204,13 @@ class GymResolvers:
         radius: float = 10.0,
         limit: int = 50,
         filters: Optional[SearchFilters] = None,
+        include_stats: bool = True,
     ) -> SearchResult:
-        """Search for gyms in a specific area"""
-        import logging
+        """Search for gyms in a specific area
 
-        logger = logging.getLogger(__name__)
+        With include_stats=False the per-source counts and average confidence
+        are reported as zero instead of being queried.
+        """
         logger.info(f"Searching for gyms in location: {location}")
 
         # Initialize city boundary service
@@ -54,74 +228,84 @@ class GymResolvers:
 
         # First, try to get from database using city boundary service
         async with get_db_session() as session:
-            # Build base query
-            query = select(Gym).options(
-                selectinload(Gym.sources), selectinload(Gym.reviews)
-            )
-
             # Use city boundary service to find gyms
             existing_gyms = []  # Initialize to empty list
 
-            # Extract state from location_info if available
-            state = None
-            if location_info:
-                # Try to extract state from geocoding result
-                if "state" in location_info:
-                    state = location_info["state"]
-                elif "address_components" in location_info:
-                    # Look for state in address components (common in geocoding results)
-                    for component in location_info.get("address_components", []):
-                        if "administrative_area_level_1" in component.get("types", []):
-                            state = component.get("short_name")
-                            break
+            # GeocodingService returns the state already extracted from every
+            # provider's response, so there is nothing to parse here
+            state = location_info.get("state")
 
             # Use city boundary service to find gyms
             try:
                 gym_results = await city_boundary_service.find_gyms_in_city(
-                    session, city_name=location, state=state, limit=limit
+                    session,
+                    city_name=location,
+                    state=state,
+                    limit=limit,
+                    geocode_result=location_info,
                 )
                 logger.info(f"Found {len(gym_results)} gyms for {location}")
 
                 # Convert city boundary service results to Gym objects
                 if gym_results:
                     # Get the gym IDs from results
-                    gym_ids = [result["id"] for result in gym_results]
-
-                    # Query to get full Gym objects with relationships
-                    query = (
-                        select(Gym)
-                        .options(selectinload(Gym.sources), selectinload(Gym.reviews))
-                        .where(Gym.id.in_(gym_ids))
-                    )
+                    gym_ids = [uuid.UUID(result["id"]) for result in gym_results]
 
-                    # Apply additional filters before executing
+                    # Additional filters apply to both the rows and the counts
+                    conditions = []
                     if filters:
                         if filters.min_rating and filters.min_rating > 0:
-                            query = query.where(Gym.rating >= filters.min_rating)
+                            conditions.append(Gym.rating >= filters.min_rating)
                         if filters.min_confidence and filters.min_confidence > 0:
-                            query = query.where(
-                                Gym.confidence >= filters.min_confidence
-                            )
+                            conditions.append(Gym.confidence >= filters.min_confidence)
                         if filters.has_website is not None:
                             if filters.has_website:
-                                query = query.where(Gym.website.isnot(None))
+                                conditions.append(Gym.website.isnot(None))
                             else:
-                                query = query.where(Gym.website.is_(None))
+                                conditions.append(Gym.website.is_(None))
                         if filters.has_instagram is not None:
                             if filters.has_instagram:
-                                query = query.where(Gym.instagram.isnot(None))
+                                conditions.append(Gym.instagram.isnot(None))
                             else:
-                                query = query.where(Gym.instagram.is_(None))
-
-                    result = await session.execute(query)
-                    existing_gyms = result.scalars().all()
+                                conditions.append(Gym.instagram.is_(None))
+                        if filters.max_distance and filters.max_distance > 0:
+                            search_point = func.ST_SetSRID(
+                                func.ST_MakePoint(
+                                    location_info.get("longitude", 0.0),
+                                    location_info.get("latitude", 0.0),
+                                ),
+                                4326,
+                            )
+                            conditions.append(
+                                func.ST_DWithin(
+                                    func.geography(Gym.location),
+                                    func.geography(search_point),
+                                    filters.max_distance * 1609.34,
+                                )
+                            )
 
-                    # Sort gyms by their original order from city boundary service
-                    gym_order = {gym_id: idx for idx, gym_id in enumerate(gym_ids)}
-                    existing_gyms.sort(
-                        key=lambda gym: gym_order.get(str(gym.id), float("inf"))
+                    # Query to get full Gym objects
+                    query = GYMS_BY_RANKED_IDS.where(*conditions)
+                    fetch_gyms = session.execute(
+                        query, {"gym_ids": gym_ids, "ranked_gym_ids": gym_ids}
                     )
 
+                    # The counts run on their own session, alongside the fetch
+                    if include_stats:
+                        # Both finish before an error propagates, so the request
+                        # session is never committed with the fetch in flight
+                        result, search_stats = await asyncio.gather(
+                            fetch_gyms,
+                            GymResolvers._search_stats(gym_ids, conditions),
+                            return_exceptions=True,
+                        )
+                        for outcome in (result, search_stats):
+                            if isinstance(outcome, BaseException):
+                                raise outcome
+                    else:
+                        result, search_stats = await fetch_gyms, EMPTY_SEARCH_STATS
+                    existing_gyms = result.scalars().all()
+
                     logger.info(f"After filtering, returning {len(existing_gyms)} gyms")
                 else:
                     logger.info("No gyms found by city boundary service")
@@ -148,27 +332,12 @@ class GymResolvers:
                     ),
                     radius_miles=radius,
                     timestamp=datetime.utcnow(),
-                    gyms=[GymResolvers._gym_to_graphql(gym) for gym in existing_gyms],
+                    gyms=await GymResolvers._gyms_to_graphql(existing_gyms),
                     total_results=len(existing_gyms),
-                    yelp_results=sum(
-                        1
-                        for gym in existing_gyms
-                        if any(s.name == "Yelp" for s in gym.sources)
-                    ),
-                    google_results=sum(
-                        1
-                        for gym in existing_gyms
-                        if any(s.name == "Google Places" for s in gym.sources)
-                    ),
-                    merged_count=sum(
-                        1 for gym in existing_gyms if len(gym.sources) > 1
-                    ),
-                    avg_confidence=(
-                        sum(gym.confidence for gym in existing_gyms)
-                        / len(existing_gyms)
-                        if existing_gyms
-                        else 0.0
-                    ),
+                    yelp_results=search_stats.yelp_results,
+                    google_results=search_stats.google_results,
+                    merged_count=search_stats.merged_count,
+                    avg_confidence=search_stats.avg_confidence or 0.0,
                     execution_time_seconds=0.1,
                     use_google=True,
                 )
@@ -220,15 +389,40 @@ class GymResolvers:
             logger.error(f"Error in search_gyms: {e}")
             raise
 
+    @staticmethod
+    async def _search_stats(gym_ids: List[uuid.UUID], conditions: list):
+        """Count per-source coverage and average confidence for a result set"""
+        per_gym = (
+            select(
+                DataSource.gym_id,
+                func.bool_or(DataSource.name == YELP_SOURCE).label("has_yelp"),
+                func.bool_or(DataSource.name == GOOGLE_PLACES_SOURCE).label(
+                    "has_google"
+                ),
+                func.count().label("source_count"),
+            )
+            .where(DataSource.gym_id.in_(gym_ids))
+            .group_by(DataSource.gym_id)
+            .subquery()
+        )
+        query = (
+            select(
+                func.count().filter(per_gym.c.has_yelp).label("yelp_results"),
+                func.count().filter(per_gym.c.has_google).label("google_results"),
+                func.count().filter(per_gym.c.source_count > 1).label("merged_count"),
+                func.avg(Gym.confidence).label("avg_confidence"),
+            )
+            .select_from(Gym)
+            .outerjoin(per_gym, per_gym.c.gym_id == Gym.id)
+            .where(Gym.id.in_(gym_ids), *conditions)
+        )
+        return (await GymResolvers._fetch_all(query))[0]
+
     @staticmethod
     async def gym_by_id(gym_id: str) -> Optional[GymType]:
         """Get a specific gym by ID"""
         async with get_db_session() as session:
-            query = (
-                select(Gym)
-                .options(selectinload(Gym.sources), selectinload(Gym.reviews))
-                .where(Gym.id == gym_id)
-            )
+            query = select(Gym).options(*GYM_READ_OPTIONS).where(Gym.id == gym_id)
 
             result = await session.execute(query)
             gym = result.scalar_one_or_none()
@@ -239,22 +433,48 @@ class GymResolvers:
 
     @staticmethod
     async def gyms_by_metro(
-        metro_code: str, limit: int = 100, offset: int = 0
-    ) -> List[GymType]:
-        """Get gyms within a metropolitan area"""
+        metro_code: str, limit: int = 100, after: Optional[str] = None
+    ) -> GymConnection:
+        """Get gyms within a metropolitan area, one keyset page at a time
+
+        limit is capped at MAX_METRO_PAGE_SIZE; callers page on with the
+        returned end cursor.
+        """
+        limit = min(limit, MAX_METRO_PAGE_SIZE)
+
         async with get_db_session() as session:
+            # Fetch one extra row to learn whether another page exists
             query = (
                 select(Gym)
-                .options(selectinload(Gym.sources), selectinload(Gym.reviews))
+                .options(*GYM_READ_OPTIONS)
                 .where(Gym.metropolitan_area_code == metro_code)
-                .offset(offset)
-                .limit(limit)
+                .order_by(Gym.created_at, Gym.id)
+                .limit(limit + 1)
             )
+            if after:
+                created_at, gym_id = _decode_gym_cursor(after)
+                query = query.where(
+                    tuple_(Gym.created_at, Gym.id) > tuple_(created_at, gym_id)
+                )
 
             result = await session.execute(query)
             gyms = result.scalars().all()
 
-            return [GymResolvers._gym_to_graphql(gym) for gym in gyms]
+            has_next_page = len(gyms) > limit
+            gyms = gyms[:limit]
+            nodes = await GymResolvers._gyms_to_graphql(gyms)
+            edges = [
+                GymEdge(cursor=_encode_gym_cursor(gym), node=node)
+                for gym, node in zip(gyms, nodes)
+            ]
+
+            return GymConnection(
+                edges=edges,
+                page_info=PageInfo(
+                    end_cursor=edges[-1].cursor if edges else None,
+                    has_next_page=has_next_page,
+                ),
+            )
 
     @staticmethod
     async def gym_analytics(location: str) -> GymAnalytics:
@@ -262,94 +482,107 @@ class GymResolvers:
         # Get location information to find gyms by coordinates
         location_info = await geocoding_service.search_location(location)
 
-        async with get_db_session() as session:
-            if (
-                location_info
-                and "latitude" in location_info
-                and "longitude" in location_info
-            ):
-                lat = location_info["latitude"]
-                lon = location_info["longitude"]
-
-                # Find gyms within 10 miles of the city center using PostGIS
-                from geoalchemy2 import WKTElement
-                from sqlalchemy import func
-
-                # Create a point for the city center
-                city_point = WKTElement(f"POINT({lon} {lat})", srid=4326)
-                radius_meters = 10 * 1609.34  # 10 miles in meters
-
-                query = select(Gym).where(
-                    func.ST_DWithin(Gym.location, city_point, radius_meters)
-                )
-                result = await session.execute(query)
-                gyms = result.scalars().all()
-            else:
-                gyms = []
+        if not (
+            location_info
+            and "latitude" in location_info
+            and "longitude" in location_info
+        ):
+            return GymResolvers._empty_analytics(location)
+
+        lat = location_info["latitude"]
+        lon = location_info["longitude"]
+
+        # Find gyms within 10 miles of the city center using PostGIS
+        city_point = func.ST_SetSRID(func.ST_MakePoint(lon, lat), 4326)
+        radius_meters = 10 * 1609.34  # 10 miles in meters
+        within_radius = func.ST_DWithin(
+            func.geography(Gym.location), func.geography(city_point), radius_meters
+        )
 
-            if not gyms:
-                return GymAnalytics(
-                    location=location,
-                    total_gyms=0,
-                    confidence_distribution="{}",
-                    source_breakdown="{}",
-                    rating_analysis="{}",
-                    density_score=0.0,
-                    market_saturation="low",
-                )
+        # Histogram buckets and rating stats are aggregated in the database, so
+        # no gym rows are loaded. Ratings of 0 count as unrated.
+        rated = Gym.rating != 0
+        stats_query = select(
+            func.count(),
+            func.count().filter(Gym.confidence < 0.2),
+            func.count().filter(Gym.confidence >= 0.2, Gym.confidence < 0.4),
+            func.count().filter(Gym.confidence >= 0.4, Gym.confidence < 0.6),
+            func.count().filter(Gym.confidence >= 0.6, Gym.confidence < 0.8),
+            func.count().filter(Gym.confidence >= 0.8),
+            func.count(Gym.rating).filter(rated),
+            func.avg(Gym.rating).filter(rated),
+            func.min(Gym.rating).filter(rated),
+            func.max(Gym.rating).filter(rated),
+        ).where(within_radius)
+
+        sources_query = (
+            select(DataSource.name, func.count())
+            .join(Gym, DataSource.gym_id == Gym.id)
+            .where(within_radius)
+            .group_by(DataSource.name)
+        )
 
-            # Calculate analytics
-            total_gyms = len(gyms)
-            confidences = [gym.confidence for gym in gyms]
-            ratings = [gym.rating for gym in gyms if gym.rating]
-
-            # Confidence distribution histogram
-            confidence_hist = {
-                "0.0-0.2": 0,
-                "0.2-0.4": 0,
-                "0.4-0.6": 0,
-                "0.6-0.8": 0,
-                "0.8-1.0": 0,
-            }
-            for conf in confidences:
-                if conf < 0.2:
-                    confidence_hist["0.0-0.2"] += 1
-                elif conf < 0.4:
-                    confidence_hist["0.2-0.4"] += 1
-                elif conf < 0.6:
-                    confidence_hist["0.4-0.6"] += 1
-                elif conf < 0.8:
-                    confidence_hist["0.6-0.8"] += 1
-                else:
-                    confidence_hist["0.8-1.0"] += 1
-
-            # Source breakdown
-            source_counts = {}
-            for gym in gyms:
-                for source in gym.sources:
-                    source_counts[source.name] = source_counts.get(source.name, 0) + 1
-
-            # Rating analysis
-            rating_stats = {
-                "count": len(ratings),
-                "average": sum(ratings) / len(ratings) if ratings else 0.0,
-                "min": min(ratings) if ratings else 0.0,
-                "max": max(ratings) if ratings else 0.0,
-            }
-
-            return GymAnalytics(
-                location=location,
-                total_gyms=total_gyms,
-                confidence_distribution=json.dumps(confidence_hist),
-                source_breakdown=json.dumps(source_counts),
-                rating_analysis=json.dumps(rating_stats),
-                density_score=total_gyms / 100.0,  # Simplified density calculation
-                market_saturation=(
-                    "high"
-                    if total_gyms > 20
-                    else "medium" if total_gyms > 10 else "low"
-                ),
+        # The two aggregates are independent, so each gets its own pooled
+        # connection and they run concurrently
+        stats_rows, source_rows = await asyncio.gather(
+            GymResolvers._fetch_all(stats_query),
+            GymResolvers._fetch_all(sources_query),
+        )
+        stats = stats_rows[0]
+        total_gyms = stats[0]
+        if not total_gyms:
+            return GymResolvers._empty_analytics(location)
+
+        # Confidence distribution histogram
+        confidence_hist = dict(
+            zip(
+                ["0.0-0.2", "0.2-0.4", "0.4-0.6", "0.6-0.8", "0.8-1.0"],
+                stats[1:6],
             )
+        )
+
+        # Source breakdown
+        source_counts = {name: count for name, count in source_rows}
+
+        # Rating analysis
+        rating_count, rating_avg, rating_min, rating_max = stats[6:]
+        rating_stats = {
+            "count": rating_count,
+            "average": rating_avg or 0.0,
+            "min": rating_min or 0.0,
+            "max": rating_max or 0.0,
+        }
+
+        return GymAnalytics(
+            location=location,
+            total_gyms=total_gyms,
+            confidence_distribution=_to_json(confidence_hist),
+            source_breakdown=_to_json(source_counts),
+            rating_analysis=_to_json(rating_stats),
+            density_score=total_gyms / 100.0,  # Simplified density calculation
+            market_saturation=(
+                "high" if total_gyms > 20 else "medium" if total_gyms > 10 else "low"
+            ),
+        )
+
+    @staticmethod
+    async def _fetch_all(query) -> list:
+        """Run a read query on its own session so it can overlap with others"""
+        async with get_db_session() as session:
+            return (await session.execute(query)).all()
+
+    @staticmethod
+    def _empty_analytics(location: str) -> GymAnalytics:
+        """Analytics for a location with no gyms"""
+        return GymAnalytics(
+            location=location,
+            total_gyms=0,
+            confidence_distribution="{}",
+            source_breakdown="{}",
+            rating_analysis="{}",
+            density_score=0.0,
+            market_saturation="low",
+        )
 
     @staticmethod
     async def market_gap_analysis(
@@ -376,33 +609,24 @@ class GymResolvers:
         """Store CLI search results in database"""
         async with get_db_session() as session:
             gyms_data = cli_result.get("gyms", [])
-            import logging
-
-            logger = logging.getLogger(__name__)
             logger.info(f"Storing {len(gyms_data)} gyms from CLI search")
 
-            for gym_data in gyms_data:
-                # Check if gym already exists
-                existing_query = select(Gym).where(
-                    and_(
-                        Gym.name == gym_data["name"], Gym.address == gym_data["address"]
-                    )
+            unique_gyms = _dedupe_cli_gyms(gyms_data)
+            if len(unique_gyms) < len(gyms_data):
+                logger.info(
+                    f"Collapsed {len(gyms_data) - len(unique_gyms)} duplicate gyms"
                 )
-                result = await session.execute(existing_query)
-                existing_gym = result.scalar_one_or_none()
-
-                if existing_gym:
-                    # Update existing gym
-                    existing_gym.confidence = gym_data["confidence"]
-                    existing_gym.rating = gym_data.get("rating")
-                    existing_gym.review_count = gym_data.get("review_count", 0)
-                    existing_gym.updated_at = datetime.utcnow()
-                    logger.info(f"Updated existing gym: {existing_gym.name}")
-                else:
-                    # Create new gym
-                    from geoalchemy2 import WKTElement
 
-                    new_gym = Gym(
+            new_gyms = []
+            new_sources = {}
+
+            for gym_data in unique_gyms:
+                # The id is generated here so data sources can be attached
+                # without reading it back; a stored gym keeps its own id
+                gym_id = uuid7()
+                new_gyms.append(
+                    dict(
+                        id=gym_id,
                         name=gym_data["name"],
                         address=gym_data["address"],
                         phone=gym_data.get("phone"),
@@ -410,10 +634,6 @@ class GymResolvers:
                         instagram=gym_data.get("instagram"),
                         latitude=gym_data["latitude"],
                         longitude=gym_data["longitude"],
-                        location=WKTElement(
-                            f"POINT({gym_data['longitude']} {gym_data['latitude']})",
-                            srid=4326,
-                        ),
                         confidence=gym_data["confidence"],
                         match_confidence=gym_data["confidence"],
                         rating=gym_data.get("rating"),
@@ -422,143 +642,200 @@ class GymResolvers:
                         metropolitan_area_code=gym_data.get("metropolitan_area_code"),
                         raw_data=gym_data.get("raw_data"),
                     )
-                    session.add(new_gym)
-                    await session.flush()  # Get the ID
-                    logger.info(f"Created new gym: {new_gym.name}")
-
-                    # Add data sources
-                    for source_data in gym_data.get("sources", []):
-                        data_source = DataSource(
-                            gym_id=new_gym.id,
-                            name=source_data["name"],
-                            confidence=source_data["confidence"],
-                            last_updated=datetime.fromisoformat(
-                                source_data["last_updated"].replace("Z", "+00:00")
-                            ),
-                        )
-                        session.add(data_source)
+                )
+                new_sources[gym_id] = [
+                    dict(
+                        id=uuid7(),
+                        gym_id=gym_id,
+                        name=source_data["name"],
+                        confidence=source_data["confidence"],
+                        last_updated=_parse_iso_timestamp(source_data["last_updated"]),
+                    )
+                    for source_data in gym_data.get("sources", [])
+                ]
+
+            upserted = await GymResolvers._upsert_gyms(session, new_gyms)
+            created = [gym_id for gym_id, inserted in upserted if inserted]
+            logger.info(
+                f"Created {len(created)} new gyms, "
+                f"updated {len(upserted) - len(created)} existing gyms"
+            )
+
+            # Data sources are only added for gyms created by this batch
+            sources = [source for gym_id in created for source in new_sources[gym_id]]
+            if sources:
+                await session.execute(insert(DataSource), sources)
 
             await session.commit()
             logger.info("Successfully committed CLI search results to database")
 
+    @staticmethod
+    async def _upsert_gyms(session, rows: List[dict]) -> List[Tuple[uuid.UUID, bool]]:
+        """
+        Insert gyms, refreshing the scores of any already stored under the
+        same (name, address) instead of probing for them first
+
+        Returns (id, inserted) for every row; inserted is False when the row
+        updated an existing gym. Rows must have distinct (name, address) keys.
+        """
+        upserted = []
+        for start in range(0, len(rows), GYM_UPSERT_BATCH_SIZE):
+            stmt = pg_insert(Gym).values(
+                [
+                    dict(
+                        row,
+                        location=func.ST_SetSRID(
+                            func.ST_MakePoint(row["longitude"], row["latitude"]), 4326
+                        ),
+                    )
+                    for row in rows[start : start + GYM_UPSERT_BATCH_SIZE]
+                ]
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Gym.name, Gym.address],
+                set_={column: stmt.excluded[column] for column in GYM_UPSERT_REFRESH},
+            ).returning(Gym.id, literal_column("xmax = 0").label("inserted"))
+            result = await session.execute(stmt)
+            upserted.extend(tuple(row) for row in result)
+        return upserted
+
+    @staticmethod
+    async def _gyms_to_graphql(gyms: List[Gym]) -> List[GymType]:
+        """Convert a list of gyms, off the event loop when the list is large"""
+        if len(gyms) > THREADED_CONVERSION_THRESHOLD:
+            return await asyncio.to_thread(
+                lambda: [GymResolvers._gym_to_graphql(gym) for gym in gyms]
+            )
+        return [GymResolvers._gym_to_graphql(gym) for gym in gyms]
+
     @staticmethod
     def _gym_to_graphql(gym: Gym) -> GymType:
-        """Convert SQLAlchemy Gym model to GraphQL type"""
+        """Convert SQLAlchemy Gym model to GraphQL type
+
+        Sources and reviews are not copied here; GymType resolves them lazily
+        through the request's DataLoaders.
+        """
+        (
+            gym_id,
+            name,
+            address,
+            latitude,
+            longitude,
+            phone,
+            website,
+            instagram,
+            confidence,
+            match_confidence,
+            rating,
+            review_count,
+            source_city,
+            metropolitan_area_code,
+            created_at,
+            updated_at,
+        ) = _gym_columns(gym)
+
         return GymType(
-            id=str(gym.id),
-            name=gym.name,
-            address=gym.address,
-            coordinates=Coordinates(latitude=gym.latitude, longitude=gym.longitude),
-            phone=gym.phone,
-            website=gym.website,
-            instagram=gym.instagram,
-            confidence=gym.confidence,
-            match_confidence=gym.match_confidence,
-            rating=gym.rating,
-            review_count=gym.review_count,
-            sources=[
-                DataSourceType(
-                    name=source.name,
-                    confidence=source.confidence,
-                    last_updated=source.last_updated,
-                )
-                for source in gym.sources
-            ],
-            reviews=[
-                ReviewType(
-                    rating=review.rating,
-                    review_count=review.review_count,
-                    sentiment_score=review.sentiment_score,
-                    source=review.source,
-                    last_updated=review.last_updated,
-                )
-                for review in gym.reviews
-            ],
-            source_city=gym.source_city,
-            metropolitan_area_code=gym.metropolitan_area_code,
-            created_at=gym.created_at,
-            updated_at=gym.updated_at,
+            id=str(gym_id),
+            name=name,
+            address=address,
+            coordinates=Coordinates(latitude=latitude, longitude=longitude),
+            phone=phone,
+            website=website,
+            instagram=instagram,
+            confidence=confidence,
+            match_confidence=match_confidence,
+            rating=rating,
+            review_count=review_count,
+            source_city=source_city,
+            metropolitan_area_code=metropolitan_area_code,
+            created_at=created_at,
+            updated_at=updated_at,
         )
 
 
 class MetroResolvers:
     """Resolvers for Metropolitan Area operations"""
 
+    # The metro catalogue ships with the CLI and only changes on deploy, so it
+    # is built once and reused: (expires_at, areas, areas_by_code)
+    _metro_cache: Optional[
+        Tuple[float, List[MetropolitanArea], Dict[str, MetropolitanArea]]
+    ] = None
+    # Lets one request reload an expired cache while concurrent ones wait for
+    # it instead of each calling the CLI bridge
+    _metro_lock = asyncio.Lock()
+
     @staticmethod
     async def metropolitan_area(code: str) -> Optional[MetropolitanArea]:
         """Get metropolitan area data by code"""
         try:
-            metro_areas = await cli_bridge_service.get_metro_areas()
-            for metro in metro_areas:
-                if metro["code"] == code:
-                    # This is a simplified implementation
-                    # In production, you'd have proper MetroStatistics calculation
-                    from .schema import MetroStatistics
-
-                    stats = MetroStatistics(
-                        total_gyms=0,
-                        merged_gyms=0,
-                        merge_rate=0.0,
-                        average_confidence=0.0,
-                        source_distribution="{}",
-                        gyms_per_zip="{}",
-                        deduplication_rate=0.0,
-                    )
-
-                    return MetropolitanArea(
-                        id=metro["code"],
-                        name=metro["name"],
-                        code=metro["code"],
-                        description=metro["description"],
-                        state=metro["state"],
-                        population=metro.get("population"),
-                        density_category=metro["density_category"],
-                        market_characteristics=metro["market_characteristics"],
-                        cities=metro.get("cities", []),
-                        statistics=stats,
-                    )
+            _, areas_by_code = await MetroResolvers._get_metro_index()
+            return areas_by_code.get(code)
         except Exception:
-            pass
-
-        return None
+            return None
 
     @staticmethod
     async def list_metropolitan_areas() -> List[MetropolitanArea]:
         """List all available metropolitan areas"""
         try:
+            areas, _ = await MetroResolvers._get_metro_index()
+            return areas
+        except Exception:
+            return []
+
+    @staticmethod
+    async def _get_metro_index() -> (
+        Tuple[List[MetropolitanArea], Dict[str, MetropolitanArea]]
+    ):
+        """Return all metro areas and a lookup by code, refreshed every TTL"""
+        cached = MetroResolvers._metro_cache
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1], cached[2]
+
+        async with MetroResolvers._metro_lock:
+            # Another request may have reloaded it while this one waited
+            cached = MetroResolvers._metro_cache
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1], cached[2]
+
             metro_areas = await cli_bridge_service.get_metro_areas()
-            result = []
-
-            for metro in metro_areas:
-                from .schema import MetroStatistics
-
-                stats = MetroStatistics(
-                    total_gyms=0,
-                    merged_gyms=0,
-                    merge_rate=0.0,
-                    average_confidence=0.0,
-                    source_distribution="{}",
-                    gyms_per_zip="{}",
-                    deduplication_rate=0.0,
-                )
+            areas = [MetroResolvers._metro_to_graphql(metro) for metro in metro_areas]
+            areas_by_code = {area.code: area for area in areas}
 
-                metro_area = MetropolitanArea(
-                    id=metro["code"],
-                    name=metro["name"],
-                    code=metro["code"],
-                    description=metro["description"],
-                    state=metro["state"],
-                    population=metro.get("population"),
-                    density_category=metro["density_category"],
-                    market_characteristics=metro["market_characteristics"],
-                    zip_codes=metro["zip_codes"],
-                    statistics=stats,
-                )
-                result.append(metro_area)
+            MetroResolvers._metro_cache = (
+                time.monotonic() + METRO_CACHE_TTL_SECONDS,
+                areas,
+                areas_by_code,
+            )
+            return areas, areas_by_code
 
-            return result
-        except Exception:
-            return []
+    @staticmethod
+    def _metro_to_graphql(metro: dict) -> MetropolitanArea:
+        """Convert a CLI metro area dict to GraphQL type"""
+        # This is a simplified implementation
+        # In production, you'd have proper MetroStatistics calculation
+        stats = MetroStatistics(
+            total_gyms=0,
+            merged_gyms=0,
+            merge_rate=0.0,
+            average_confidence=0.0,
+            source_distribution="{}",
+            gyms_per_zip="{}",
+            deduplication_rate=0.0,
+        )
+
+        return MetropolitanArea(
+            id=metro["code"],
+            name=metro["name"],
+            code=metro["code"],
+            description=metro["description"],
+            state=metro["state"],
+            population=metro.get("population"),
+            density_category=metro["density_category"],
+            market_characteristics=metro["market_characteristics"],
+            cities=metro.get("cities", []),
+            statistics=stats,
+        )
 
 
 class MutationResolvers:
@@ -574,30 +851,12 @@ class MutationResolvers:
             start_time = datetime.utcnow()
 
             async with get_db_session() as session:
+                rows = []
+
                 for gym_data in data:
                     try:
-                        # Check if gym exists
-                        existing_query = select(Gym).where(
-                            and_(
-                                Gym.name == gym_data.name,
-                                Gym.address == gym_data.address,
-                            )
-                        )
-                        result = await session.execute(existing_query)
-                        existing_gym = result.scalar_one_or_none()
-
-                        if existing_gym:
-                            # Update existing
-                            existing_gym.confidence = gym_data.confidence
-                            existing_gym.rating = gym_data.rating
-                            existing_gym.review_count = gym_data.review_count
-                            existing_gym.updated_at = datetime.utcnow()
-                            gyms_updated += 1
-                        else:
-                            # Create new
-                            from geoalchemy2 import WKTElement
-
-                            new_gym = Gym(
+                        rows.append(
+                            dict(
                                 name=gym_data.name,
                                 address=gym_data.address,
                                 phone=gym_data.phone,
@@ -605,10 +864,6 @@ class MutationResolvers:
                                 instagram=gym_data.instagram,
                                 latitude=gym_data.latitude,
                                 longitude=gym_data.longitude,
-                                location=WKTElement(
-                                    f"POINT({gym_data.longitude} {gym_data.latitude})",
-                                    srid=4326,
-                                ),
                                 confidence=gym_data.confidence,
                                 match_confidence=gym_data.confidence,
                                 rating=gym_data.rating,
@@ -616,12 +871,22 @@ class MutationResolvers:
                                 source_city=location,
                                 raw_data={"imported": True},
                             )
-                            session.add(new_gym)
-                            gyms_imported += 1
+                        )
 
                     except Exception as e:
                         errors.append(f"Failed to import {gym_data.name}: {str(e)}")
 
+                # Repeats within this import collapse like CLI results do; the
+                # most confident record is the one written
+                new_gyms = _dedupe_cli_gyms(rows)
+                gyms_updated += len(rows) - len(new_gyms)
+
+                # Gyms already stored under the same (name, address) are
+                # updated in place by the upsert
+                upserted = await GymResolvers._upsert_gyms(session, new_gyms)
+                gyms_imported = sum(1 for _, inserted in upserted if inserted)
+                gyms_updated += len(upserted) - gyms_imported
+
             end_time = datetime.utcnow()
             duration = (end_time - start_time).total_seconds()
 
@@ -648,8 +913,6 @@ class MutationResolvers:
         Trigger a gym search for a location.
         Returns a search_id to track progress via subscription.
         """
-        import asyncio
-
         # Create search in progress manager
         search_id = search_progress_manager.create_search(location, radius)
 
@@ -663,11 +926,6 @@ class MutationResolvers:
     @staticmethod
     async def _perform_gym_search(search_id: str, location: str, radius: float):
         """Perform the actual gym search with progress updates."""
-        import asyncio
-        import logging
-
-        logger = logging.getLogger(__name__)
-
         # Set a 5-minute timeout for the entire search operation
         search_timeout = 300  # 5 minutes
 
@@ -699,9 +957,11 @@ class MutationResolvers:
         search_id: str, location: str, radius: float
     ):
         """Internal method to perform the actual gym search."""
-        import logging
-
-        logger = logging.getLogger(__name__)
+        # The existing-data check only needs the location string, so it runs
+        # on its own session while the geocoder is being called
+        existing_check = asyncio.create_task(
+            MutationResolvers._has_gyms_for_city(location)
+        )
 
         try:
             # Step 1: Geocoding (10% progress)
@@ -737,22 +997,16 @@ class MutationResolvers:
                 search_id, "searching", 30.0, "Checking existing data"
             )
 
-            async with get_db_session() as session:
-                # Check if we already have gyms for this city
-                query = select(Gym).where(Gym.source_city == search_location).limit(1)
-                result = await session.execute(query)
-                existing_gym = result.scalar_one_or_none()
-
-                if existing_gym:
-                    # We already have data
-                    await search_progress_manager.update_progress(
-                        search_id,
-                        "complete",
-                        100.0,
-                        "Search complete",
-                        message="Found existing gym data in database",
-                    )
-                    return
+            if await existing_check:
+                # We already have data
+                await search_progress_manager.update_progress(
+                    search_id,
+                    "complete",
+                    100.0,
+                    "Search complete",
+                    message="Found existing gym data in database",
+                )
+                return
 
             # Step 3: Search Yelp (50% progress)
             await search_progress_manager.update_progress(
@@ -808,3 +1062,16 @@ class MutationResolvers:
                 search_id, "error", 0.0, "Search failed", message=str(e)
             )
             raise  # Re-raise to be caught by timeout handler
+        finally:
+            # Stops the check on early exits; awaiting it retrieves any error
+            # so asyncio does not log it as never retrieved
+            existing_check.cancel()
+            with suppress(BaseException):
+                await existing_check
+
+    @staticmethod
+    async def _has_gyms_for_city(city: str) -> bool:
+        """Check whether gyms from a previous search of this city are stored"""
+        async with get_db_session() as session:
+            query = select(exists().where(Gym.source_city == city))
+            return (await session.execute(query)).scalar()
@@ -4,15 +4,25 @@ Advanced gym discovery platform with intelligent confidence scoring
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Set
 
 import strawberry
+from strawberry.extensions import ParserCache, ValidationCache
+from strawberry.types import Info
+from strawberry.types.nodes import FragmentSpread, InlineFragment, Selection
+
+from .extensions import IntrospectionCache
 
 
 @strawberry.type
 class Coordinates:
     """Geographic coordinates for gym locations"""
 
+    # Types created once per gym, source or review in a result list use slots,
+    # so large responses carry no per-object __dict__. Slotted fields cannot
+    # have class-level defaults.
+    __slots__ = ("latitude", "longitude")
+
     latitude: float
     longitude: float
 
@@ -21,6 +31,8 @@ class Coordinates:
 class DataSource:
     """Data source information for gym records"""
 
+    __slots__ = ("name", "confidence", "last_updated")
+
     name: str  # "Yelp", "Google Places", "Merged"
     confidence: float
     last_updated: datetime
@@ -30,9 +42,11 @@ class DataSource:
 class Review:
     """Gym review data aggregated from multiple sources"""
 
+    __slots__ = ("rating", "review_count", "sentiment_score", "source", "last_updated")
+
     rating: float
     review_count: int
-    sentiment_score: Optional[float] = None
+    sentiment_score: Optional[float]
     source: str
     last_updated: datetime
 
@@ -50,14 +64,12 @@ class Gym:
     instagram: Optional[str] = None
 
     # Intelligence data
-    sources: List[DataSource]
     confidence: float  # Confidence score (0.0-1.0)
     match_confidence: float  # Cross-source matching confidence
 
     # Review aggregation
     rating: Optional[float] = None
     review_count: Optional[int] = None
-    reviews: List[Review]
 
     # Metadata
     source_city: Optional[str] = None  # Origin city for batch searches
@@ -65,6 +77,44 @@ class Gym:
     created_at: datetime
     updated_at: datetime
 
+    # Nested data is resolved through per-request DataLoaders so a list of
+    # gyms costs one query per relation, and only when the client asks for it
+    @strawberry.field
+    async def sources(self, info: Info) -> List[DataSource]:
+        """Data sources that contributed to this gym record"""
+        return await info.context["sources_loader"].load(self.id)
+
+    @strawberry.field
+    async def reviews(self, info: Info) -> List[Review]:
+        """Aggregated reviews for this gym"""
+        return await info.context["reviews_loader"].load(self.id)
+
+
+@strawberry.type
+class PageInfo:
+    """Cursor pagination state for a connection"""
+
+    end_cursor: Optional[str] = None  # Pass as `after` to fetch the next page
+    has_next_page: bool
+
+
+@strawberry.type
+class GymEdge:
+    """A gym in a paginated list, with its cursor"""
+
+    __slots__ = ("cursor", "node")
+
+    cursor: str
+    node: Gym
+
+
+@strawberry.type
+class GymConnection:
+    """One page of gyms (Relay connection)"""
+
+    edges: List[GymEdge]
+    page_info: PageInfo
+
 
 @strawberry.type
 class MetroStatistics:
@@ -150,6 +200,7 @@ class SearchProgress:
 
     search_id: str
     status: str  # pending, searching_yelp, searching_google, merging, complete, error
+    # A "behind" status means this subscriber missed updates and is resyncing
     progress_percentage: float
     current_step: str
     estimated_completion: Optional[datetime] = None
@@ -223,6 +274,17 @@ class CityAutocomplete:
     secondary_text: str
 
 
+def _selected_names(selections: List[Selection]) -> Set[str]:
+    """Field names requested at one level, looking through fragments"""
+    names = set()
+    for selection in selections:
+        if isinstance(selection, (FragmentSpread, InlineFragment)):
+            names |= _selected_names(selection.selections)
+        else:
+            names.add(selection.name)
+    return names
+
+
 @strawberry.type
 class Query:
     """GraphQL query operations"""
@@ -230,6 +292,7 @@ class Query:
     @strawberry.field
     async def search_gyms(
         self,
+        info: Info,
         location: str,  # Can be zipcode or city name
         radius: float = 10.0,
         limit: int = 50,
@@ -239,10 +302,17 @@ class Query:
         Search for gyms by location (city name).
         If no data exists, automatically fetches from external sources.
         """
-        from .resolvers import GymResolvers
+        from .resolvers import SEARCH_STATS_FIELDS, GymResolvers
+
+        # The source counts cost an extra query; skip it when not requested
+        selected = _selected_names(info.selected_fields[0].selections)
 
         return await GymResolvers.search_gyms_by_location(
-            location, radius, limit, filters
+            location,
+            radius,
+            limit,
+            filters,
+            include_stats=not selected.isdisjoint(SEARCH_STATS_FIELDS),
         )
 
     @strawberry.field
@@ -307,12 +377,12 @@ class Query:
 
     @strawberry.field
     async def gyms_by_metro(
-        self, metro_code: str, limit: int = 100, offset: int = 0
-    ) -> List[Gym]:
-        """Get gyms within a metropolitan area with pagination"""
+        self, metro_code: str, limit: int = 100, after: Optional[str] = None
+    ) -> GymConnection:
+        """Get gyms within a metropolitan area with cursor pagination"""
         from .resolvers import GymResolvers
 
-        return await GymResolvers.gyms_by_metro(metro_code, limit, offset)
+        return await GymResolvers.gyms_by_metro(metro_code, limit, after)
 
 
 # Mutation Root
@@ -393,14 +463,14 @@ class Subscription:
         """Subscribe to search progress updates"""
         from ..services.search_progress import search_progress_manager
 
-        queue = None
+        subscription = None
         try:
             # Subscribe to updates for this search
-            queue = await search_progress_manager.subscribe(search_id)
+            subscription = await search_progress_manager.subscribe(search_id)
 
             # Yield progress updates until complete
             while True:
-                progress = await queue.get()
+                progress = await subscription.get()
                 yield progress
 
                 # Stop when search is complete or errored
@@ -418,9 +488,19 @@ class Subscription:
             )
         finally:
             # Clean up subscription
-            if queue is not None:
-                search_progress_manager.unsubscribe(search_id, queue)
-
-
-# Schema definition
-schema = strawberry.Schema(query=Query, mutation=Mutation, subscription=Subscription)
+            if subscription is not None:
+                search_progress_manager.unsubscribe(search_id, subscription)
+
+
+# Schema definition. Clients repeat the same few documents, so parsing and
+# validation are cached by query string, and introspection results whole
+schema = strawberry.Schema(
+    query=Query,
+    mutation=Mutation,
+    subscription=Subscription,
+    extensions=[
+        ParserCache(maxsize=256),
+        ValidationCache(maxsize=256),
+        IntrospectionCache,
+    ],
+)
@@ -3,19 +3,98 @@ GymIntel Web Application - FastAPI + GraphQL Backend
 High-performance gym discovery platform with PostgreSQL and real-time updates
 """
 
+import asyncio
 import logging
 import os
+from contextlib import asynccontextmanager, suppress
 
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from strawberry.fastapi import GraphQLRouter
 
 from .config import settings
+from .database import pool_stats
+from .graphql.loaders import create_loaders
+from .graphql.persisted_queries import PersistedQueryRouter
 from .graphql.schema import schema
+from .services.google_places import places_caller
 
 logger = logging.getLogger(__name__)
 
+# orjson is optional; responses fall back to the stdlib encoder
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:
+    import json
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+
+def _env_flag(name: str) -> bool:
+    """Whether a development-only opt-in environment variable is set"""
+    return (
+        settings.environment == "development"
+        and os.environ.get(name, "false").lower() == "true"
+    )
+
+
+async def prepare_database(app: FastAPI):
+    """Initialize and seed the development database if requested.
+
+    database_ready is only set once every requested step succeeded; a failed
+    step is recorded in database_error instead.
+    """
+    # Auto-initialize database in development if requested
+    if _env_flag("AUTO_INIT_DB"):
+        try:
+            from app.db_init import init_database
+
+            await init_database()
+            logger.info("Database initialized successfully")
+        except Exception as e:
+            logger.error(f"Failed to initialize database: {e}")
+            app.state.database_error = f"Failed to initialize database: {e}"
+            return
+
+    # Seed database with sample data if requested
+    if _env_flag("SEED_DATABASE"):
+        try:
+            from app.seed_data import seed_development_data
+
+            await seed_development_data()
+            logger.info("Database seeded with sample data")
+        except Exception as e:
+            logger.error(f"Failed to seed database: {e}")
+            app.state.database_error = f"Failed to seed database: {e}"
+            return
+
+    app.state.database_ready = True
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start serving while database setup runs in the background."""
+    logger.info("Starting GymIntel API...")
+
+    # A previous startup of this app object may have finished or failed setup
+    app.state.database_ready = False
+    app.state.database_error = None
+
+    task = asyncio.create_task(prepare_database(app))
+    try:
+        yield
+    finally:
+        # Setup still running at shutdown is abandoned, not waited for
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+
 # Create FastAPI application
 app = FastAPI(
     title="GymIntel GraphQL API",
@@ -23,7 +102,11 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
+# Set by prepare_database once setup succeeds or fails; reported by /health
+app.state.database_ready = False
+app.state.database_error = None
 
 # Configure CORS for frontend integration
 app.add_middleware(
@@ -38,70 +121,70 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Create GraphQL router
-graphql_app = GraphQLRouter(
-    schema, graphql_ide="graphiql"  # Enable GraphQL playground in development
-)
-
-# Include GraphQL router
-app.include_router(graphql_app, prefix="/graphql")
 
+async def get_graphql_context():
+    """Build per-request GraphQL context with fresh DataLoaders"""
+    return create_loaders()
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize the application."""
-    logger.info("Starting GymIntel API...")
-
-    # Auto-initialize database in development if requested
-    if (
-        settings.environment == "development"
-        and os.environ.get("AUTO_INIT_DB", "false").lower() == "true"
-    ):
-        try:
-            from app.db_init import init_database
 
-            await init_database()
-            logger.info("Database initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize database: {e}")
-
-    # Seed database with sample data if requested
-    if (
-        settings.environment == "development"
-        and os.environ.get("SEED_DATABASE", "false").lower() == "true"
-    ):
-        try:
-            from app.seed_data import seed_development_data
+# Create GraphQL router; clients may send persisted query hashes (Apollo APQ)
+graphql_app = PersistedQueryRouter(
+    schema,
+    graphql_ide="graphiql",  # Enable GraphQL playground in development
+    context_getter=get_graphql_context,
+)
 
-            await seed_development_data()
-            logger.info("Database seeded with sample data")
-        except Exception as e:
-            logger.error(f"Failed to seed database: {e}")
+# Include GraphQL router
+app.include_router(graphql_app, prefix="/graphql")
 
 
-@app.get("/")
-async def root():
-    """Health check endpoint"""
-    return {
+# The root payload never changes, so it is encoded once
+ROOT_RESPONSE_BODY = _dumps(
+    {
         "message": "GymIntel GraphQL API",
         "version": "1.0.0",
         "status": "healthy",
         "endpoints": {"graphql": "/graphql", "playground": "/graphql", "docs": "/docs"},
     }
+)
+
+
+@app.get("/")
+async def root():
+    """Health check endpoint"""
+    return Response(ROOT_RESPONSE_BODY, media_type="application/json")
+
+
+# Everything but the live stats is encoded once; the stats object is spliced
+# in after the static keys
+HEALTH_RESPONSE_PREFIX = (
+    _dumps(
+        {
+            "status": "healthy",
+            "database": "connected",  # TODO: Add actual DB health check
+            "services": {
+                "yelp_api": "configured",
+                "google_places": "configured",
+                "postgresql": "connected",
+            },
+        }
+    )[:-1]
+    + b","
+)
 
 
 @app.get("/health")
 async def health_check():
     """Detailed health check for monitoring"""
-    return {
-        "status": "healthy",
-        "database": "connected",  # TODO: Add actual DB health check
-        "services": {
-            "yelp_api": "configured",
-            "google_places": "configured",
-            "postgresql": "connected",
-        },
-    }
+    stats = _dumps(
+        {
+            "database_ready": app.state.database_ready,
+            "database_error": app.state.database_error,
+            "google_places_calls": places_caller.stats(),
+            "database_pool": pool_stats(),
+        }
+    )
+    return Response(HEALTH_RESPONSE_PREFIX + stats[1:], media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -2,16 +2,46 @@
 Gym-related database models
 """
 
+import os
+import time
 import uuid
-from datetime import datetime
+from typing import Final
 
 from geoalchemy2 import Geometry
-from sqlalchemy import JSON, Column, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.orm import declarative_base, deferred, relationship
 
 Base = declarative_base()
 
+# Timestamps are stamped by the database in UTC, matching the naive UTC values
+# the app has always stored, instead of by a Python call per row
+UTC_NOW = text("timezone('utc', now())")
+
+
+def uuid7() -> uuid.UUID:
+    """Time-ordered UUID (RFC 9562 version 7) for primary keys
+
+    The leading 48 bits are the Unix time in milliseconds, so new rows land at
+    the right edge of the primary key index instead of at random pages.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = timestamp_ms << 80 | int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | 0x7 << 76  # Version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
 
 class Gym(Base):
     """Main gym entity with multi-source intelligence"""
@@ -19,17 +49,17 @@ class Gym(Base):
     __tablename__ = "gyms"
 
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     # Basic gym information
-    name = Column(String(255), nullable=False, index=True)
+    name = Column(String(255), nullable=False)
     address = Column(Text, nullable=False)
     phone = Column(String(50), nullable=True)
     website = Column(String(500), nullable=True)
     instagram = Column(String(100), nullable=True)
 
     # Geographic data (PostGIS geometry)
-    location = Column(Geometry("POINT", srid=4326), nullable=False, index=True)
+    location = Column(Geometry("POINT", srid=4326), nullable=False)
     latitude = Column(Float, nullable=False)  # Denormalized for easier access
     longitude = Column(Float, nullable=False)
 
@@ -49,31 +79,60 @@ class Gym(Base):
     source_city = Column(
         String(255), nullable=True, index=True
     )  # Origin city for batch searches
-    metropolitan_area_code = Column(String(20), nullable=True, index=True)
-    raw_data = Column(JSON, nullable=True)  # Store original API responses
+    metropolitan_area_code = Column(String(20), nullable=True)
+    # Original API responses; deferred so plain Gym selects skip the blob
+    raw_data = deferred(Column(JSON, nullable=True))
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=UTC_NOW, nullable=False)
     updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=UTC_NOW, onupdate=UTC_NOW, nullable=False
     )
 
-    # Relationships
+    # Relationships. Implicit loads raise: under asyncio they would fail at
+    # runtime anyway, and GraphQL reads go through the DataLoaders. Use
+    # selectinload() where a query needs them.
     sources = relationship(
-        "DataSource", back_populates="gym", cascade="all, delete-orphan"
+        "DataSource", back_populates="gym", cascade="all, delete-orphan", lazy="raise"
+    )
+    reviews = relationship(
+        "Review", back_populates="gym", cascade="all, delete-orphan", lazy="raise"
     )
-    reviews = relationship("Review", back_populates="gym", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        # Keyset pagination for gymsByMetro
+        Index("ix_gyms_metro_created_id", "metropolitan_area_code", "created_at", "id"),
+        # Natural key for imports; conflict target of the import upsert. Also
+        # serves lookups by name alone
+        Index("uq_gyms_name_address", "name", "address", unique=True),
+        # Radius searches measure in meters on location::geography, which the
+        # geometry index on location cannot serve
+        Index(
+            "ix_gyms_location_geography",
+            text("(location::geography)"),
+            postgresql_using="gist",
+        ),
+    )
+
+    # The database stamps updated_at on UPDATE; fetch it back with RETURNING
+    # so reading it after a flush does not trigger lazy IO under asyncio
+    __mapper_args__ = {"eager_defaults": True}
 
     def __repr__(self):
         return f"<Gym(id={self.id}, name='{self.name}', confidence={self.confidence})>"
 
 
+# Fixed source names stored in DataSource.name and Review.source
+YELP_SOURCE: Final = "Yelp"
+GOOGLE_PLACES_SOURCE: Final = "Google Places"
+
+
 class DataSource(Base):
     """Data source information for gym records"""
 
     __tablename__ = "data_sources"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     gym_id = Column(UUID(as_uuid=True), ForeignKey("gyms.id"), nullable=False)
 
     # Source details
@@ -82,11 +141,11 @@ class DataSource(Base):
     source_id = Column(String(100), nullable=True)  # External API ID
 
     # Metadata
-    last_updated = Column(DateTime, default=datetime.utcnow, nullable=False)
+    last_updated = Column(DateTime, server_default=UTC_NOW, nullable=False)
     api_response = Column(JSON, nullable=True)  # Raw API response
 
     # Relationships
-    gym = relationship("Gym", back_populates="sources")
+    gym = relationship("Gym", back_populates="sources", lazy="raise")
 
     def __repr__(self):
         return f"<DataSource(name='{self.name}', confidence={self.confidence})>"
@@ -97,7 +156,7 @@ class Review(Base):
 
     __tablename__ = "reviews"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     gym_id = Column(UUID(as_uuid=True), ForeignKey("gyms.id"), nullable=False)
 
     # Review metrics
@@ -113,10 +172,10 @@ class Review(Base):
     sample_review_text = Column(Text, nullable=True)
 
     # Metadata
-    last_updated = Column(DateTime, default=datetime.utcnow, nullable=False)
+    last_updated = Column(DateTime, server_default=UTC_NOW, nullable=False)
 
     # Relationships
-    gym = relationship("Gym", back_populates="reviews")
+    gym = relationship("Gym", back_populates="reviews", lazy="raise")
 
     def __repr__(self):
         return (
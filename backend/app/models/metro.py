@@ -2,15 +2,12 @@
 Metropolitan area database models
 """
 
-import uuid
-from datetime import datetime
-
 from geoalchemy2 import Geometry
 from sqlalchemy import Column, DateTime, Float, Integer, String
 from sqlalchemy.dialects.postgresql import UUID
 
 # Import Base from gym module
-from .gym import Base
+from .gym import UTC_NOW, Base, uuid7
 
 
 class MetropolitanArea(Base):
@@ -19,7 +16,7 @@ class MetropolitanArea(Base):
     __tablename__ = "metropolitan_areas"
 
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     # MSA identification
     code = Column(String(20), unique=True, nullable=False, index=True)  # CBSA code
@@ -49,10 +46,13 @@ class MetropolitanArea(Base):
     last_gym_count_update = Column(DateTime, nullable=True)
 
     # Metadata
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=UTC_NOW, nullable=False)
     updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=UTC_NOW, onupdate=UTC_NOW, nullable=False
     )
 
+    # Return server-set timestamps on flush (see Gym)
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self):
         return f"<MetropolitanArea(code='{self.code}', name='{self.name}')>"
@@ -2,9 +2,6 @@
 User and saved search database models
 """
 
-import uuid
-from datetime import datetime
-
 from sqlalchemy import (
     JSON,
     Boolean,
@@ -13,6 +10,7 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Integer,
     String,
     Text,
 )
@@ -20,7 +18,7 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 # Import Base from gym module
-from .gym import Base
+from .gym import UTC_NOW, Base, uuid7
 
 
 class User(Base):
@@ -29,7 +27,7 @@ class User(Base):
     __tablename__ = "users"
 
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     # Authentication
     email = Column(String(255), unique=True, nullable=False, index=True)
@@ -42,21 +40,27 @@ class User(Base):
     last_name = Column(String(100), nullable=True)
 
     # Preferences
-    default_search_radius = Column(String(20), nullable=True, default="25")  # miles
+    default_search_radius = Column(Float, nullable=True, default=25.0)  # miles
     email_notifications = Column(Boolean, default=True, nullable=False)
 
     # Metadata
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=UTC_NOW, nullable=False)
     updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=UTC_NOW, onupdate=UTC_NOW, nullable=False
     )
     last_login = Column(DateTime, nullable=True)
 
     # Relationships
     saved_searches = relationship(
-        "SavedSearch", back_populates="user", cascade="all, delete-orphan"
+        "SavedSearch",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        lazy="raise",
     )
 
+    # Return server-set timestamps on flush (see Gym)
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self):
         return f"<User(id={self.id}, email='{self.email}')>"
 
@@ -67,13 +71,13 @@ class SavedSearch(Base):
     __tablename__ = "saved_searches"
 
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
 
     # Search parameters
     name = Column(String(100), nullable=False)  # User-defined name
     location = Column(String(100), nullable=False, index=True)  # City name or zipcode
-    radius = Column(String(20), nullable=False, default="25")  # miles
+    radius = Column(Float, nullable=False, default=25.0)  # miles
 
     # Resolved location coordinates (cached from geocoding)
     resolved_latitude = Column(Float, nullable=True)
@@ -89,19 +93,19 @@ class SavedSearch(Base):
 
     # Search results cache
     last_search_date = Column(DateTime, nullable=True)
-    gym_count = Column(String(50), nullable=True)  # e.g., "45 gyms found"
+    gym_count = Column(Integer, nullable=True)  # Gyms found by the last run
 
     # Notes
     notes = Column(Text, nullable=True)
 
     # Metadata
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=UTC_NOW, nullable=False)
     updated_at = Column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=UTC_NOW, onupdate=UTC_NOW, nullable=False
     )
 
     # Relationships
-    user = relationship("User", back_populates="saved_searches")
+    user = relationship("User", back_populates="saved_searches", lazy="raise")
 
     # Table constraints
     __table_args__ = (
@@ -117,5 +121,8 @@ class SavedSearch(Base):
         ),
     )
 
+    # Return server-set timestamps on flush (see Gym)
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self):
         return f"<SavedSearch(name='{self.name}', location='{self.location}')>"
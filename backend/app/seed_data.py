@@ -10,13 +10,12 @@ This module provides functions to populate the database with:
 import asyncio
 import json
 import logging
-from datetime import datetime
 from typing import Dict
-from uuid import uuid4
 
 from app.database import get_db_session
-from app.models.gym import DataSource, Gym, Review
+from app.models.gym import DataSource, Gym, Review, uuid7
 from app.models.metro import MetropolitanArea
+from geoalchemy2 import WKTElement
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -183,10 +182,7 @@ async def seed_metro_areas(session: AsyncSession) -> Dict[str, MetropolitanArea]
 
         if not metro:
             metro = MetropolitanArea(
-                id=uuid4(),
                 **metro_data,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
             )
             session.add(metro)
             logger.info(f"Created metro area: {metro.name}")
@@ -224,8 +220,6 @@ async def seed_gyms(
 
             # Create PostGIS point
             if gym_dict.get("latitude") and gym_dict.get("longitude"):
-                from geoalchemy2 import WKTElement
-
                 point = WKTElement(
                     f"POINT({gym_dict['longitude']} {gym_dict['latitude']})",
                     srid=4326,
@@ -233,10 +227,8 @@ async def seed_gyms(
                 gym_dict["location"] = point
 
             gym = Gym(
-                id=uuid4(),
+                id=uuid7(),
                 **gym_dict,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
             )
             session.add(gym)
             logger.info(f"Created gym: {gym.name}")
@@ -245,7 +237,6 @@ async def seed_gyms(
             if gym_data.get("rating") is not None:
                 # Google source
                 google_source = DataSource(
-                    id=uuid4(),
                     gym_id=gym.id,
                     name="Google Places",
                     source_id=f"google_{gym.id}",
@@ -254,13 +245,11 @@ async def seed_gyms(
                         "rating": gym_data["rating"],
                         "review_count": gym_data["review_count"] // 2,
                     },
-                    last_updated=datetime.utcnow(),
                 )
                 session.add(google_source)
 
                 # Yelp source
                 yelp_source = DataSource(
-                    id=uuid4(),
                     gym_id=gym.id,
                     name="Yelp",
                     source_id=f"yelp_{gym.id}",
@@ -269,7 +258,6 @@ async def seed_gyms(
                         "rating": gym_data["rating"],
                         "review_count": gym_data["review_count"] // 2,
                     },
-                    last_updated=datetime.utcnow(),
                 )
                 session.add(yelp_source)
 
@@ -298,7 +286,6 @@ async def seed_reviews(session: AsyncSession, gym_map: Dict[str, Gym]) -> None:
 
             if not existing:
                 new_review = Review(
-                    id=uuid4(),
                     gym_id=gym.id,
                     rating=review["rating"],
                     review_count=review["review_count"],
@@ -306,7 +293,6 @@ async def seed_reviews(session: AsyncSession, gym_map: Dict[str, Gym]) -> None:
                     source=review["source"],
                     source_url=review.get("source_url"),
                     sample_review_text=review.get("sample_review_text"),
-                    last_updated=datetime.utcnow(),
                 )
                 session.add(new_review)
                 logger.info(f"Created {review['source']} reviews for {gym.name}")
@@ -352,7 +338,6 @@ async def import_from_cli_export(json_file_path: str) -> None:
             if not existing:
                 # Transform CLI data to our schema
                 gym = Gym(
-                    id=uuid4(),
                     name=gym_data["name"],
                     address=gym_data["address"],
                     phone=gym_data.get("phone"),
@@ -365,14 +350,10 @@ async def import_from_cli_export(json_file_path: str) -> None:
                     review_count=gym_data.get("review_count", 0),
                     source_city=gym_data.get("source_city"),
                     raw_data=gym_data,
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
                 )
 
                 # Create location point if coordinates exist
                 if gym.latitude and gym.longitude:
-                    from geoalchemy2 import WKTElement
-
                     gym.location = WKTElement(
                         f"POINT({gym.longitude} {gym.latitude})",
                         srid=4326,
@@ -0,0 +1,78 @@
+"""
+Bounded-concurrency caller for rate-limited external APIs
+"""
+
+import asyncio
+import logging
+import random
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Status codes that mean "try again later" rather than "this request is wrong"
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Throttling, server errors and dropped connections are worth retrying"""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(error, httpx.TransportError)
+
+
+class AsyncCaller:
+    """Caps concurrent calls to an API and retries transient failures
+
+    Calls beyond max_concurrency wait for a free slot instead of adding to a
+    burst the provider would throttle. A retryable failure is retried up to
+    max_retries times with jittered exponential backoff, sleeping outside the
+    slot so other callers can proceed.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        max_retries: int = 3,
+        base_delay: float = 0.25,
+        max_delay: float = 4.0,
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+        # Counters for monitoring
+        self.queued = 0  # Calls currently waiting for a slot
+        self.retries = 0  # Retries since startup
+
+    async def call(self, fn: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
+        """Await fn(*args, **kwargs) within the concurrency limit"""
+        attempt = 0
+        while True:
+            self.queued += 1
+            try:
+                await self._semaphore.acquire()
+            finally:
+                self.queued -= 1
+
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                if attempt >= self.max_retries or not _is_retryable(e):
+                    raise
+                logger.warning(f"Retrying external call after error: {e}")
+            finally:
+                self._semaphore.release()
+
+            delay = min(self.max_delay, self.base_delay * 2**attempt)
+            attempt += 1
+            self.retries += 1
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+
+    def stats(self) -> Dict[str, Any]:
+        """Current queue depth and retry count"""
+        return {"queued": self.queued, "retries": self.retries}
@@ -11,6 +11,88 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
+FIND_GYMS_IN_CITY_SQL = text(
+    """
+    SELECT
+        g.id,
+        g.name,
+        g.address,
+        ST_X(g.location::geometry) as longitude,
+        ST_Y(g.location::geometry) as latitude,
+        g.phone,
+        g.website,
+        g.instagram,
+        g.confidence,
+        g.match_confidence,
+        g.rating,
+        g.review_count,
+        g.source_city,
+        g.metropolitan_area_code,
+        ST_Distance(
+            g.location::geography,
+            ST_MakePoint(:lng, :lat)::geography
+        ) / 1609.34 as distance_miles
+    FROM gyms g
+    WHERE g.source_city ILIKE :city_pattern
+       OR ST_DWithin(
+            g.location::geography,
+            ST_MakePoint(:lng, :lat)::geography,
+            :radius_meters
+        )
+    ORDER BY distance_miles
+    LIMIT :limit
+    """
+)
+
+FIND_GYMS_NEAR_LOCATION_SQL = text(
+    """
+    SELECT
+        g.id,
+        g.name,
+        g.address,
+        ST_X(g.location::geometry) as longitude,
+        ST_Y(g.location::geometry) as latitude,
+        g.phone,
+        g.website,
+        g.instagram,
+        g.confidence,
+        g.match_confidence,
+        g.rating,
+        g.review_count,
+        g.source_city,
+        g.metropolitan_area_code,
+        ST_Distance(
+            g.location::geography,
+            ST_MakePoint(:lng, :lat)::geography
+        ) / 1609.34 as distance_miles
+    FROM gyms g
+    WHERE ST_DWithin(
+        g.location::geography,
+        ST_MakePoint(:lng, :lat)::geography,
+        :radius_meters
+    )
+    ORDER BY distance_miles
+    LIMIT :limit
+    """
+)
+
+CITY_STATS_SQL = text(
+    """
+    SELECT
+        COUNT(*) as total_gyms,
+        AVG(g.confidence) as avg_confidence,
+        AVG(g.rating) FILTER (WHERE g.rating IS NOT NULL) as avg_rating,
+        COUNT(DISTINCT g.source_city) as unique_cities
+    FROM gyms g
+    WHERE g.source_city ILIKE :city_pattern
+       OR ST_DWithin(
+            g.location::geography,
+            ST_MakePoint(:lng, :lat)::geography,
+            :radius_meters
+        )
+    """
+)
+
 
 class CityBoundaryService:
     """Service for city boundary-based geographic queries"""
@@ -24,6 +106,7 @@ class CityBoundaryService:
         city_name: str,
         state: Optional[str] = None,
         limit: int = 100,
+        geocode_result: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Find all gyms within a city's boundaries using PostGIS
@@ -33,13 +116,16 @@ class CityBoundaryService:
             city_name: Name of the city
             state: Optional state abbreviation for disambiguation
             limit: Maximum number of results
+            geocode_result: Coordinates the caller already resolved for this
+                city; skips the geocoding call when given
 
         Returns:
             List of gyms within the city boundaries
         """
         # First, geocode the city to get coordinates
         location_str = f"{city_name}, {state}" if state else city_name
-        geocode_result = await self.geocoding_service.search_location(location_str)
+        if geocode_result is None:
+            geocode_result = await self.geocoding_service.search_location(location_str)
 
         if not geocode_result:
             logger.warning(f"Could not geocode city: {location_str}")
@@ -49,38 +135,7 @@ class CityBoundaryService:
         # In a full implementation, you would query actual city boundaries
         # from a PostGIS table containing city polygons
 
-        query = text(
-            """
-            SELECT
-                g.id,
-                g.name,
-                g.address,
-                ST_X(g.location::geometry) as longitude,
-                ST_Y(g.location::geometry) as latitude,
-                g.phone,
-                g.website,
-                g.instagram,
-                g.confidence,
-                g.match_confidence,
-                g.rating,
-                g.review_count,
-                g.source_city,
-                g.metropolitan_area_code,
-                ST_Distance(
-                    g.location::geography,
-                    ST_MakePoint(:lng, :lat)::geography
-                ) / 1609.34 as distance_miles
-            FROM gyms g
-            WHERE g.source_city ILIKE :city_pattern
-               OR ST_DWithin(
-                    g.location::geography,
-                    ST_MakePoint(:lng, :lat)::geography,
-                    :radius_meters
-                )
-            ORDER BY distance_miles
-            LIMIT :limit
-        """
-        )
+        query = FIND_GYMS_IN_CITY_SQL
 
         # Use a 15-mile radius for city searches (covers most city areas)
         radius_meters = 15 * 1609.34
@@ -139,37 +194,7 @@ class CityBoundaryService:
         Returns:
             List of gyms within the specified radius
         """
-        query = text(
-            """
-            SELECT
-                g.id,
-                g.name,
-                g.address,
-                ST_X(g.location::geometry) as longitude,
-                ST_Y(g.location::geometry) as latitude,
-                g.phone,
-                g.website,
-                g.instagram,
-                g.confidence,
-                g.match_confidence,
-                g.rating,
-                g.review_count,
-                g.source_city,
-                g.metropolitan_area_code,
-                ST_Distance(
-                    g.location::geography,
-                    ST_MakePoint(:lng, :lat)::geography
-                ) / 1609.34 as distance_miles
-            FROM gyms g
-            WHERE ST_DWithin(
-                g.location::geography,
-                ST_MakePoint(:lng, :lat)::geography,
-                :radius_meters
-            )
-            ORDER BY distance_miles
-            LIMIT :limit
-        """
-        )
+        query = FIND_GYMS_NEAR_LOCATION_SQL
 
         radius_meters = radius_miles * 1609.34
 
@@ -232,22 +257,7 @@ class CityBoundaryService:
                 "avg_rating": 0,
             }
 
-        query = text(
-            """
-            SELECT
-                COUNT(*) as total_gyms,
-                AVG(g.confidence) as avg_confidence,
-                AVG(g.rating) FILTER (WHERE g.rating IS NOT NULL) as avg_rating,
-                COUNT(DISTINCT g.source_city) as unique_cities
-            FROM gyms g
-            WHERE g.source_city ILIKE :city_pattern
-               OR ST_DWithin(
-                    g.location::geography,
-                    ST_MakePoint(:lng, :lat)::geography,
-                    :radius_meters
-                )
-        """
-        )
+        query = CITY_STATS_SQL
 
         radius_meters = 15 * 1609.34  # 15-mile radius for city
 
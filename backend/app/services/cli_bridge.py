@@ -9,6 +9,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ..models.gym import GOOGLE_PLACES_SOURCE, YELP_SOURCE
+
 # Add CLI services to Python path
 CLI_PATH = Path(__file__).parent.parent.parent.parent.parent / "gymintel-cli" / "src"
 sys.path.insert(0, str(CLI_PATH))
@@ -227,12 +229,12 @@ class CLIBridgeService:
                 sources.extend(
                     [
                         {
-                            "name": "Yelp",
+                            "name": YELP_SOURCE,
                             "confidence": confidence,
                             "last_updated": datetime.utcnow().isoformat(),
                         },
                         {
-                            "name": "Google Places",
+                            "name": GOOGLE_PLACES_SOURCE,
                             "confidence": confidence,
                             "last_updated": datetime.utcnow().isoformat(),
                         },
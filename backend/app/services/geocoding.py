@@ -5,6 +5,7 @@ Geocoding service for converting cities to coordinates and location information.
 import logging
 import re
 import ssl
+from collections import OrderedDict
 from typing import List, Optional, Tuple
 
 import certifi
@@ -20,12 +21,18 @@ logger = logging.getLogger(__name__)
 class GeocodingService:
     """Service for geocoding operations."""
 
-    def __init__(self, timeout: int = 10):
+    def __init__(self, timeout: int = 10, cache_size: int = 4096):
         """Initialize the geocoding service.
 
         Args:
             timeout: Timeout in seconds for geocoding requests (default: 10)
+            cache_size: Number of resolved locations kept in memory
+                (default: 4096)
         """
+        # Resolved locations keyed by normalized query, in LRU order
+        self._cache: "OrderedDict[str, dict]" = OrderedDict()
+        self._cache_size = cache_size
+
         # Create SSL context with proper certificates
         ctx = ssl.create_default_context(cafile=certifi.where())
 
@@ -52,6 +59,30 @@ class GeocodingService:
         Returns:
             Dict with location info including coordinates, city, state, etc.
         """
+        key = self._cache_key(query)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return dict(cached)
+
+        location_info = await self._search_location_uncached(query)
+
+        # Failed lookups are not cached so a transient geocoder error is retried
+        if location_info:
+            self._cache[key] = location_info
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+            return dict(location_info)
+
+        return location_info
+
+    @staticmethod
+    def _cache_key(query: str) -> str:
+        """Normalize a location query so equivalent spellings share an entry."""
+        return " ".join(query.replace(",", " ").lower().split())
+
+    async def _search_location_uncached(self, query: str) -> Optional[dict]:
+        """Resolve a location query against the geocoding providers."""
         # Check if query is a zipcode (for backward compatibility)
         if self._is_zipcode(query):
             return await self._get_location_from_zipcode(query)
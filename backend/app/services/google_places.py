@@ -3,15 +3,29 @@ Google Places API Service for location validation and autocomplete
 """
 
 import logging
+import sys
+import time
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple
 
 import httpx
 from pydantic import BaseModel
 
 from ..config import settings
+from .async_caller import AsyncCaller
 
 logger = logging.getLogger(__name__)
 
+# Shared by every Places/Geocoding request in the process so a burst of
+# GraphQL requests (autocomplete fires per keystroke) stays under the quota
+places_caller = AsyncCaller(max_concurrency=8)
+
+# Autocomplete runs per keystroke and users type the same prefixes, so
+# suggestions are reused briefly; inputs shorter than this are not cached
+AUTOCOMPLETE_CACHE_TTL_SECONDS = 60
+AUTOCOMPLETE_CACHE_SIZE = 4096
+AUTOCOMPLETE_MIN_CACHED_LENGTH = 2
+
 
 class PlaceDetails(BaseModel):
     """Structured place details from Google Places API"""
@@ -40,6 +54,19 @@ class GooglePlacesService:
         self.geocoding_url = "https://maps.googleapis.com/maps/api/geocode"
         self.client = httpx.AsyncClient(timeout=10.0)
 
+        # (normalized input, country) -> (expires_at, suggestions), LRU order
+        self._autocomplete_cache: "OrderedDict[Tuple[str, str], tuple]" = OrderedDict()
+
+    async def _send(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request through the shared caller; raises on HTTP errors"""
+
+        async def send() -> httpx.Response:
+            response = await self.client.request(method, url, **kwargs)
+            response.raise_for_status()
+            return response
+
+        return await places_caller.call(send)
+
     async def autocomplete_cities(
         self, input_text: str, country: str = "us"
     ) -> List[Dict[str, any]]:
@@ -53,6 +80,35 @@ class GooglePlacesService:
         Returns:
             List of city suggestions with place_id and description
         """
+        normalized = " ".join(input_text.lower().split())
+        if len(normalized) < AUTOCOMPLETE_MIN_CACHED_LENGTH:
+            return await self._autocomplete_cities_uncached(input_text, country)
+
+        key = (normalized, country.lower())
+        cached = self._autocomplete_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            self._autocomplete_cache.move_to_end(key)
+            return list(cached[1])
+
+        predictions = await self._autocomplete_cities_uncached(input_text, country)
+
+        # Empty results are not cached; they are also what an API error returns
+        if predictions:
+            self._autocomplete_cache[key] = (
+                time.monotonic() + AUTOCOMPLETE_CACHE_TTL_SECONDS,
+                predictions,
+            )
+            self._autocomplete_cache.move_to_end(key)
+            if len(self._autocomplete_cache) > AUTOCOMPLETE_CACHE_SIZE:
+                self._autocomplete_cache.popitem(last=False)
+            return list(predictions)
+
+        return predictions
+
+    async def _autocomplete_cities_uncached(
+        self, input_text: str, country: str
+    ) -> List[Dict[str, any]]:
+        """Fetch city suggestions from the Places API"""
         if not self.api_key:
             logger.warning("Google Places API key not configured")
             return []
@@ -72,10 +128,12 @@ class GooglePlacesService:
                 "languageCode": "en-US",
             }
 
-            response = await self.client.post(
-                f"{self.base_url}/places:autocomplete", headers=headers, json=body
+            response = await self._send(
+                "POST",
+                f"{self.base_url}/places:autocomplete",
+                headers=headers,
+                json=body,
             )
-            response.raise_for_status()
 
             data = response.json()
 
@@ -98,14 +156,16 @@ class GooglePlacesService:
                     text_info = place_prediction.get("text", {})
                     structured = place_prediction.get("structuredFormat", {})
 
+                    # City and region names repeat across cached suggestions
+                    main_text = structured.get("mainText", {}).get("text", "")
+                    secondary_text = structured.get("secondaryText", {}).get("text", "")
+
                     predictions.append(
                         {
                             "place_id": place_prediction.get("placeId", ""),
                             "description": text_info.get("text", ""),
-                            "main_text": structured.get("mainText", {}).get("text", ""),
-                            "secondary_text": structured.get("secondaryText", {}).get(
-                                "text", ""
-                            ),
+                            "main_text": sys.intern(main_text),
+                            "secondary_text": sys.intern(secondary_text),
                         }
                     )
 
@@ -137,10 +197,9 @@ class GooglePlacesService:
                 "X-Goog-FieldMask": "id,displayName,formattedAddress,location,addressComponents,types",  # noqa: E501
             }
 
-            response = await self.client.get(
-                f"{self.base_url}/places/{place_id}", headers=headers
+            response = await self._send(
+                "GET", f"{self.base_url}/places/{place_id}", headers=headers
             )
-            response.raise_for_status()
 
             data = response.json()
 
@@ -243,10 +302,9 @@ class GooglePlacesService:
                 "key": self.api_key,
             }
 
-            response = await self.client.get(
-                f"{self.geocoding_url}/json", params=params
+            response = await self._send(
+                "GET", f"{self.geocoding_url}/json", params=params
             )
-            response.raise_for_status()
 
             data = response.json()
 
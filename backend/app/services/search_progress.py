@@ -5,7 +5,7 @@ Search progress tracking for real-time updates.
 import asyncio
 import json
 import logging
-from contextlib import suppress
+from collections import deque
 from datetime import datetime, timedelta
 from typing import Dict, Optional
 from uuid import uuid4
@@ -14,6 +14,84 @@ from app.graphql.schema import SearchProgress
 
 logger = logging.getLogger(__name__)
 
+# Finished searches stay queryable for late subscribers this long (5 minutes)
+CLEANUP_DELAY_SECONDS = 300
+
+# Non-terminal updates for a search arriving within this window reach
+# subscribers once, as the latest of them; complete/error go out immediately
+PROGRESS_COALESCE_SECONDS = 0.02
+
+TERMINAL_STATUSES = frozenset({"complete", "error"})
+
+# Updates retained per search for subscribers that have not read them yet; a
+# subscriber that falls further behind gets a "behind" marker and resumes at
+# the oldest retained update
+PROGRESS_BUFFER_SIZE = 64
+
+
+class ProgressChannel:
+    """Broadcast buffer for one search's updates.
+
+    Publishing appends once and wakes every waiting reader, so its cost does
+    not depend on the number of subscribers, and a stalled subscriber holds
+    on to at most PROGRESS_BUFFER_SIZE updates. Overflow drops the oldest
+    updates; a complete/error update is the last one published, so it is
+    always retained.
+    """
+
+    def __init__(self, search_id: str):
+        self.search_id = search_id
+        self.updates: deque = deque(maxlen=PROGRESS_BUFFER_SIZE)
+        self.published = 0  # Sequence number of the next update
+        self.readers = 0
+        self._published_event = asyncio.Event()
+
+    def publish(self, progress: SearchProgress):
+        """Append an update and wake all readers."""
+        self.updates.append(progress)
+        self.published += 1
+        event, self._published_event = self._published_event, asyncio.Event()
+        event.set()
+
+    async def wait(self):
+        """Wait until the next update is published."""
+        await self._published_event.wait()
+
+
+class ProgressSubscription:
+    """A subscriber's read position in a search's ProgressChannel."""
+
+    def __init__(self, channel: ProgressChannel, snapshot: SearchProgress):
+        self.channel = channel
+        self._cursor = channel.published
+        self._snapshot: Optional[SearchProgress] = snapshot
+
+    async def get(self) -> SearchProgress:
+        """Return the next update, waiting for one if necessary."""
+        if self._snapshot is not None:
+            snapshot, self._snapshot = self._snapshot, None
+            return snapshot
+
+        channel = self.channel
+        while self._cursor == channel.published:
+            await channel.wait()
+
+        oldest = channel.published - len(channel.updates)
+        if self._cursor < oldest:
+            missed = oldest - self._cursor
+            self._cursor = oldest
+            return SearchProgress(
+                search_id=channel.search_id,
+                status="behind",
+                progress_percentage=channel.updates[0].progress_percentage,
+                current_step="Resyncing",
+                message=f"Missed {missed} progress updates",
+            )
+
+        progress = channel.updates[self._cursor - oldest]
+        self._cursor += 1
+        return progress
+
 
 class SearchProgressManager:
     """Manages search progress for real-time updates."""
@@ -39,7 +117,9 @@ class SearchProgressManager:
         # - Persistent progress tracking if backend restarts
         # - Automatic cleanup with Redis TTL
         self._searches: Dict[str, Dict] = {}
-        self._subscribers: Dict[str, list] = {}
+        self._channels: Dict[str, ProgressChannel] = {}
+        # Latest undelivered update per search, flushed by a timer
+        self._pending: Dict[str, SearchProgress] = {}
 
     def create_search(self, location: str, radius: float) -> str:
         """Create a new search and return its ID."""
@@ -57,8 +137,8 @@ class SearchProgressManager:
             "location_info": None,
         }
 
-        # Initialize subscriber list
-        self._subscribers[search_id] = []
+        # Initialize the broadcast channel
+        self._channels[search_id] = ProgressChannel(search_id)
 
         logger.info(f"Created search {search_id} for location: {location}")
         return search_id
@@ -87,52 +167,56 @@ class SearchProgressManager:
             search["location_info"] = json.dumps(location_info)
 
         # Update estimated completion based on progress
-        if status not in ["complete", "error"]:
+        if status not in TERMINAL_STATUSES:
             remaining_time = (100 - progress) * 0.3  # ~0.3 seconds per percent
             search["estimated_completion"] = datetime.utcnow() + timedelta(
                 seconds=remaining_time
             )
 
-        # Create progress object
-        progress_obj = SearchProgress(
-            search_id=search_id,
-            status=status,
-            progress_percentage=progress,
-            current_step=current_step,
-            estimated_completion=(
-                search["estimated_completion"] if status != "complete" else None
-            ),
-            message=message,
-            location_info=search.get("location_info"),
-        )
-
-        # Notify all subscribers
-        await self._notify_subscribers(search_id, progress_obj)
-
-        # Clean up completed searches after a delay
-        if status in ["complete", "error"]:
-            asyncio.create_task(self._cleanup_search(search_id))
+        # Notify all subscribers; nobody listening means nothing to build
+        channel = self._channels.get(search_id)
+        if channel is not None and channel.readers:
+            progress_obj = SearchProgress(
+                search_id=search_id,
+                status=status,
+                progress_percentage=progress,
+                current_step=current_step,
+                estimated_completion=(
+                    search["estimated_completion"] if status != "complete" else None
+                ),
+                message=message,
+                location_info=search.get("location_info"),
+            )
+            if status in TERMINAL_STATUSES:
+                # Supersedes anything still waiting in the coalescing window
+                self._pending.pop(search_id, None)
+                channel.publish(progress_obj)
+            else:
+                if search_id not in self._pending:
+                    asyncio.get_running_loop().call_later(
+                        PROGRESS_COALESCE_SECONDS, self._flush_progress, search_id
+                    )
+                self._pending[search_id] = progress_obj
 
-    async def _notify_subscribers(self, search_id: str, progress: SearchProgress):
-        """Notify all subscribers of a search progress update."""
-        subscribers = self._subscribers.get(search_id, [])
+        # Clean up completed searches after a delay; a timer handle rather
+        # than a task parked in asyncio.sleep for the whole delay
+        if status in TERMINAL_STATUSES:
+            asyncio.get_running_loop().call_later(
+                CLEANUP_DELAY_SECONDS, self._cleanup_search, search_id
+            )
 
-        # Send progress to all subscribers
-        for queue in subscribers:
-            try:
-                await queue.put(progress)
-            except Exception as e:
-                logger.error(f"Error notifying subscriber: {e}")
+    def _flush_progress(self, search_id: str):
+        """Deliver the latest coalesced update for a search, if any."""
+        progress = self._pending.pop(search_id, None)
+        channel = self._channels.get(search_id)
+        if progress is not None and channel is not None:
+            channel.publish(progress)
 
-    async def subscribe(self, search_id: str) -> asyncio.Queue:
+    async def subscribe(self, search_id: str) -> ProgressSubscription:
         """Subscribe to search progress updates."""
         if search_id not in self._searches:
             raise ValueError(f"Search {search_id} not found")
 
-        # Create a queue for this subscriber
-        queue = asyncio.Queue()
-        self._subscribers[search_id].append(queue)
-
         # Send current status immediately
         search = self._searches[search_id]
         current_progress = SearchProgress(
@@ -144,25 +228,24 @@ class SearchProgressManager:
             message=search.get("message"),
             location_info=search.get("location_info"),
         )
-        await queue.put(current_progress)
 
-        return queue
+        channel = self._channels[search_id]
+        channel.readers += 1
+        return ProgressSubscription(channel, current_progress)
 
-    def unsubscribe(self, search_id: str, queue: asyncio.Queue):
+    def unsubscribe(self, search_id: str, subscription: ProgressSubscription):
         """Unsubscribe from search progress updates."""
-        if search_id in self._subscribers:
-            with suppress(ValueError):
-                self._subscribers[search_id].remove(queue)
-
-    async def _cleanup_search(self, search_id: str, delay: int = 300):
-        """Clean up search data after a delay (5 minutes default)."""
-        await asyncio.sleep(delay)
+        subscription.channel.readers -= 1
 
+    def _cleanup_search(self, search_id: str):
+        """Clean up search data once its retention delay has passed."""
         if search_id in self._searches:
             del self._searches[search_id]
 
-        if search_id in self._subscribers:
-            del self._subscribers[search_id]
+        if search_id in self._channels:
+            del self._channels[search_id]
+
+        self._pending.pop(search_id, None)
 
         logger.info(f"Cleaned up search {search_id}")
 
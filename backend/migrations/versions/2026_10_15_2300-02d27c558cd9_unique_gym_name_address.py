@@ -0,0 +1,60 @@
+"""Merge duplicate gyms and add the unique (name, address) index
+
+Gym imports upsert with ON CONFLICT (name, address), which needs this index.
+Duplicates are merged into the most confident row (newest on ties); their
+data sources and reviews are moved to that row before the rest are deleted.
+
+Revision ID: 02d27c558cd9
+Revises:
+Create Date: 2026-10-15 23:00:00
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "02d27c558cd9"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE TEMPORARY TABLE gym_duplicates ON COMMIT DROP AS
+        SELECT id, keep_id
+        FROM (
+            SELECT
+                id,
+                first_value(id) OVER (
+                    PARTITION BY name, address
+                    ORDER BY confidence DESC, updated_at DESC, id
+                ) AS keep_id
+            FROM gyms
+        ) ranked
+        WHERE id <> keep_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE data_sources SET gym_id = d.keep_id
+        FROM gym_duplicates d WHERE data_sources.gym_id = d.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE reviews SET gym_id = d.keep_id
+        FROM gym_duplicates d WHERE reviews.gym_id = d.id
+        """
+    )
+    op.execute("DELETE FROM gyms USING gym_duplicates d WHERE gyms.id = d.id")
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_gyms_name_address "
+        "ON gyms (name, address)"
+    )
+
+
+def downgrade() -> None:
+    # Merged duplicates are not restored
+    op.execute("DROP INDEX IF EXISTS uq_gyms_name_address")
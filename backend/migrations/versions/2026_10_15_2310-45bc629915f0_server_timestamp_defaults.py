@@ -0,0 +1,46 @@
+"""Default timestamp columns to the database clock
+
+Timestamps are filled in by the server (timezone('utc', now())) rather
+than by Python. Tables created before that have no column default, so
+inserts that leave the timestamps out, such as the gym upserts and the
+seed data, would fail their NOT NULL constraints.
+
+Revision ID: 45bc629915f0
+Revises: 02d27c558cd9
+Create Date: 2026-10-15 23:10:00
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "45bc629915f0"
+down_revision = "02d27c558cd9"
+branch_labels = None
+depends_on = None
+
+TIMESTAMP_COLUMNS = (
+    ("gyms", "created_at"),
+    ("gyms", "updated_at"),
+    ("data_sources", "last_updated"),
+    ("reviews", "last_updated"),
+    ("metropolitan_areas", "created_at"),
+    ("metropolitan_areas", "updated_at"),
+    ("users", "created_at"),
+    ("users", "updated_at"),
+    ("saved_searches", "created_at"),
+    ("saved_searches", "updated_at"),
+)
+
+
+def upgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            "SET DEFAULT timezone('utc', now())"
+        )
+
+
+def downgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
@@ -0,0 +1,79 @@
+"""Store search radii and saved-search gym counts as numbers
+
+users.default_search_radius and saved_searches.radius become double
+precision, and saved_searches.gym_count becomes an integer. Text values
+such as "25 miles" or "45 gyms found" keep their leading number. Columns
+that already have the numeric type (tables built from the current models)
+are left alone.
+
+Revision ID: 26a5389e50f5
+Revises: 45bc629915f0
+Create Date: 2026-10-15 23:20:00
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "26a5389e50f5"
+down_revision = "45bc629915f0"
+branch_labels = None
+depends_on = None
+
+# (table, column, new type, USING expression) for columns still stored as text
+NUMERIC_COLUMNS = (
+    (
+        "users",
+        "default_search_radius",
+        "double precision",
+        "substring(default_search_radius from '[0-9]+(?:\\.[0-9]+)?')"
+        "::double precision",
+    ),
+    (
+        "saved_searches",
+        "radius",
+        "double precision",
+        "coalesce(substring(radius from '[0-9]+(?:\\.[0-9]+)?')"
+        "::double precision, 25.0)",
+    ),
+    (
+        "saved_searches",
+        "gym_count",
+        "integer",
+        "substring(gym_count from '[0-9]+')::integer",
+    ),
+)
+
+TEXT_COLUMNS = (
+    ("users", "default_search_radius", "varchar(20)"),
+    ("saved_searches", "radius", "varchar(20)"),
+    ("saved_searches", "gym_count", "varchar(50)"),
+)
+
+
+def upgrade() -> None:
+    for table, column, column_type, using in NUMERIC_COLUMNS:
+        op.execute(
+            f"""
+            DO $$
+            BEGIN
+                IF EXISTS (
+                    SELECT 1 FROM information_schema.columns
+                    WHERE table_name = '{table}'
+                      AND column_name = '{column}'
+                      AND data_type = 'character varying'
+                ) THEN
+                    ALTER TABLE {table}
+                        ALTER COLUMN {column} TYPE {column_type} USING {using};
+                END IF;
+            END $$;
+            """
+        )
+
+
+def downgrade() -> None:
+    for table, column, column_type in TEXT_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {column_type} "
+            f"USING {column}::text"
+        )
@@ -0,0 +1,46 @@
+"""Index gym locations as geography for radius searches
+
+Radius searches filter on ST_DWithin(location::geography, point, meters),
+which the geometry GIST index on location cannot serve. This adds a GIST
+expression index on (location::geography) and drops two indexes the models
+no longer declare: ix_gyms_name, covered by the (name, address) unique
+index, and the btree ix_gyms_location, which only served equality.
+
+The indexes are built and dropped CONCURRENTLY so gyms stay writable.
+
+Revision ID: 8f3b1c2d4e5a
+Revises: 26a5389e50f5
+Create Date: 2026-10-16 09:00:00
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8f3b1c2d4e5a"
+down_revision = "26a5389e50f5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_gyms_location_geography "
+            "ON gyms USING gist ((location::geography))"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_gyms_name")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_gyms_location")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_gyms_location "
+            "ON gyms (location)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_gyms_name ON gyms (name)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_gyms_location_geography")
@@ -0,0 +1,41 @@
+"""Index gyms for keyset pagination by metro area
+
+gymsByMetro pages with WHERE metropolitan_area_code = ? ORDER BY
+created_at, id. The composite (metropolitan_area_code, created_at, id)
+index serves both the filter and the order, and replaces the single-column
+ix_gyms_metropolitan_area_code, which it covers by prefix.
+
+The indexes are built and dropped CONCURRENTLY so gyms stay writable.
+
+Revision ID: b7e2a9c4d1f6
+Revises: 8f3b1c2d4e5a
+Create Date: 2026-10-16 09:10:00
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b7e2a9c4d1f6"
+down_revision = "8f3b1c2d4e5a"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_gyms_metro_created_id "
+            "ON gyms (metropolitan_area_code, created_at, id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_gyms_metropolitan_area_code")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_gyms_metropolitan_area_code "
+            "ON gyms (metropolitan_area_code)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_gyms_metro_created_id")
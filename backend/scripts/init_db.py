@@ -19,7 +19,7 @@ backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if backend_dir not in sys.path:
     sys.path.insert(0, backend_dir)
 
-from app.database import Base, engine  # noqa: E402
+from app.database import Base, get_engine  # noqa: E402
 from app.db_init import init_database  # noqa: E402
 
 logging.basicConfig(level=logging.INFO)
@@ -28,7 +28,7 @@ logger = logging.getLogger(__name__)
 
 async def drop_all_tables():
     """Drop all tables. Use with caution!"""
-    async with engine.begin() as conn:
+    async with get_engine().begin() as conn:
         # Drop all tables
         await conn.run_sync(Base.metadata.drop_all)
         logger.info("All tables dropped")
@@ -83,7 +83,8 @@ async def main():
         await drop_all_tables()
 
     # Initialize database (create tables, install PostGIS, etc.)
-    await init_database()
+    # After a forced drop there is nothing to check before creating tables
+    await init_database(fresh=force)
 
     # Try to run Alembic migrations
     logger.info("Running Alembic migrations...")
@@ -37,7 +37,7 @@ from typing import List
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.config import get_settings  # noqa: E402
+from app.config import settings  # noqa: E402
 from app.database import get_db_session  # noqa: E402
 from app.models import Gym  # noqa: E402
 from app.seed_data import refresh_gym_data  # noqa: E402
@@ -164,8 +164,6 @@ async def main():
 
     args = parser.parse_args()
 
-    settings = get_settings()
-
     if settings.environment != "production":
         logger.warning(
             f"Running production refresh in {settings.environment} environment"
@@ -28,7 +28,7 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.config import get_settings  # noqa: E402
+from app.config import settings  # noqa: E402
 from app.seed_data import (  # noqa: E402
     import_from_cli_export,
     refresh_gym_data,
@@ -92,8 +92,6 @@ async def main():
 
     args = parser.parse_args()
 
-    settings = get_settings()
-
     try:
         if args.import_file:
             # Import from file
@@ -30,6 +30,27 @@ except ImportError as e:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# uvloop ships with uvicorn[standard]; fall back to the stdlib loop where it
+# is unavailable (Windows, minimal installs). Only uvicorn's loop= setting
+# selects it, so importing this module leaves the event loop policy alone
+try:
+    import uvloop  # noqa: F401
+
+    event_loop = "uvloop"
+except ImportError:
+    event_loop = "asyncio"
+logger.info(f"Using {event_loop} event loop")
+
+# httptools is also part of uvicorn[standard]; name it explicitly so a missing
+# parser shows up in the logs instead of a silent switch to h11
+try:
+    import httptools  # noqa: F401
+
+    http_protocol = "httptools"
+except ImportError:
+    http_protocol = "h11"
+logger.info(f"Using {http_protocol} HTTP parser")
+
 if __name__ == "__main__":
     # Get port from Railway or default to 8000
     port = int(os.environ.get("PORT", 8000))
@@ -62,4 +83,11 @@ if __name__ == "__main__":
             # Continue anyway - the app might work with existing tables
 
     # Run the application
-    uvicorn.run("app.main:app", host="0.0.0.0", port=port, log_level="info")
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=port,
+        log_level="info",
+        loop=event_loop,
+        http=http_protocol,
+    )
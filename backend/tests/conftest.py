@@ -3,18 +3,19 @@ Pytest configuration and fixtures for backend tests
 """
 
 import asyncio
+from contextlib import asynccontextmanager
 
 import pytest
 import pytest_asyncio
-from app.config import get_settings
+from app.config import settings
 from app.database import get_db
+from app.graphql import resolvers
 from app.main import app
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 # Get test database URL from settings
-settings = get_settings()
 TEST_DATABASE_URL = settings.async_test_database_url
 
 # Create async test engine
@@ -42,7 +43,8 @@ async def db_session():
         # Import Base after engine is created
         from app.models.gym import Base
 
-        await conn.run_sync(Base.metadata.create_all)
+        # Tables are dropped after every test, so skip existence checks
+        await conn.run_sync(Base.metadata.create_all, checkfirst=False)
 
     # Create session
     async with TestingSessionLocal() as session:
@@ -73,3 +75,50 @@ async def async_client(override_get_db):
     """Create an async test client."""
     async with AsyncClient(app=app, base_url="http://test") as client:
         yield client
+
+
+class FakeResult:
+    """Result stub answering the accessors the resolvers call"""
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+    def scalar_one_or_none(self):
+        return self._rows[0] if self._rows else None
+
+
+class FakeSession:
+    """Session stub recording each statement and answering it with the rows"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    async def execute(self, statement, params=None):
+        self.statements.append(statement)
+        return FakeResult(self.rows)
+
+
+@pytest.fixture
+def fake_db_session(request, monkeypatch):
+    """Serve the resolvers' get_db_session from a FakeSession.
+
+    Rows come from indirect parametrization and default to none.
+    """
+    session = FakeSession(getattr(request, "param", []))
+
+    @asynccontextmanager
+    async def fake_get_db_session():
+        yield session
+
+    monkeypatch.setattr(resolvers, "get_db_session", fake_get_db_session)
+    return session
@@ -0,0 +1,62 @@
+"""
+Tests for the bounded-concurrency external API caller
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from app.services.async_caller import AsyncCaller
+
+
+def _status_error(status_code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://places.example")
+    response = httpx.Response(status_code, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_are_capped():
+    """No more than max_concurrency calls run at once"""
+    caller = AsyncCaller(max_concurrency=2)
+    running = []
+    peak = []
+
+    async def call():
+        running.append(1)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.pop()
+
+    await asyncio.gather(*(caller.call(call) for _ in range(6)))
+
+    assert max(peak) == 2
+
+
+@pytest.mark.asyncio
+async def test_throttled_calls_are_retried():
+    """A 429 is retried with backoff until the call succeeds"""
+    caller = AsyncCaller(base_delay=0)
+    attempts = []
+
+    async def call():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise _status_error(429)
+        return "ok"
+
+    assert await caller.call(call) == "ok"
+    assert caller.stats() == {"queued": 0, "retries": 2}
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried():
+    """A 400 is the caller's fault and surfaces immediately"""
+    caller = AsyncCaller(base_delay=0)
+
+    async def call():
+        raise _status_error(400)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await caller.call(call)
+    assert caller.retries == 0
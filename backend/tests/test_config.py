@@ -0,0 +1,63 @@
+"""
+Tests for application settings
+"""
+
+import pytest
+from app.config import Settings, _env_file
+from pydantic import ValidationError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
+
+
+def test_async_database_url_converts_driver():
+    """A plain postgresql:// URL is rewritten to use asyncpg"""
+    settings = Settings(database_url="postgresql://user:pw@db:5432/gyms")
+    assert settings.async_database_url == "postgresql+asyncpg://user:pw@db:5432/gyms"
+
+
+def test_async_database_url_is_cached():
+    """The async URL is built once per Settings instance"""
+    settings = Settings(database_url="postgresql://user:pw@db:5432/gyms")
+    assert settings.async_database_url is settings.async_database_url
+    assert "async_database_url" in settings.__dict__
+
+
+def test_pool_class_for_postgres():
+    """Postgres URLs use the async queue pool, even if a host says sqlite"""
+    settings = Settings(database_url="postgresql://user:pw@sqlite-proxy:5432/gyms")
+    assert settings.pool_class is AsyncAdaptedQueuePool
+
+
+def test_pool_class_for_sqlite():
+    """SQLite URLs share a single connection through StaticPool"""
+    settings = Settings(database_url="sqlite+aiosqlite:///:memory:")
+    assert settings.pool_class is StaticPool
+
+
+def test_settings_are_frozen():
+    """Settings cannot be reassigned after construction"""
+    settings = Settings()
+    with pytest.raises(ValidationError):
+        settings.debug = True
+
+
+def test_env_file_skipped_in_production(monkeypatch):
+    """Production relies on injected env vars and never reads .env"""
+    monkeypatch.setenv("ENVIRONMENT", "production")
+    assert _env_file() is None
+
+    monkeypatch.setenv("ENVIRONMENT", "development")
+    assert _env_file() == ".env"
+
+
+def test_environment_is_normalized():
+    """ENVIRONMENT is lowercased once at construction"""
+    settings = Settings(environment=" Production ")
+    assert settings.environment == "production"
+    assert settings.is_production
+    assert not settings.is_testing
+
+
+def test_unknown_environment_is_rejected():
+    """Typos in ENVIRONMENT fail at startup instead of silently mismatching"""
+    with pytest.raises(ValidationError):
+        Settings(environment="prod")
@@ -0,0 +1,33 @@
+"""
+Tests for database initialization helpers
+"""
+
+from app.db_init import _is_missing_database
+
+
+class _PostgresError(Exception):
+    def __init__(self, sqlstate):
+        super().__init__(sqlstate)
+        self.sqlstate = sqlstate
+
+
+class _WrappedError(Exception):
+    def __init__(self, orig):
+        super().__init__(str(orig))
+        self.orig = orig
+
+
+def test_missing_database_detected_from_driver_error():
+    """asyncpg's InvalidCatalogNameError carries SQLSTATE 3D000"""
+    assert _is_missing_database(_PostgresError("3D000"))
+
+
+def test_missing_database_detected_through_sqlalchemy_wrapper():
+    """SQLAlchemy DBAPIError exposes the driver error as .orig"""
+    assert _is_missing_database(_WrappedError(_PostgresError("3D000")))
+
+
+def test_other_errors_are_not_missing_database():
+    """Auth failures and unrelated errors are reported as-is"""
+    assert not _is_missing_database(_PostgresError("28P01"))
+    assert not _is_missing_database(RuntimeError("boom"))
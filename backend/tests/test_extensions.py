@@ -0,0 +1,45 @@
+"""
+Test the schema extensions that reuse work across identical operations
+"""
+
+from collections import OrderedDict
+
+import pytest
+from app.graphql.extensions import IntrospectionCache
+from app.graphql.resolvers import MetroResolvers
+from app.graphql.schema import schema
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(IntrospectionCache, "_results", OrderedDict())
+
+
+@pytest.mark.asyncio
+async def test_introspection_result_is_reused():
+    """A repeated introspection query is answered from the first result"""
+    query = "query Meta { __schema { queryType { name } } }"
+
+    first = await schema.execute(query)
+    second = await schema.execute(query)
+
+    assert first.errors is None
+    assert second.data == {"__schema": {"queryType": {"name": "Query"}}}
+    assert second.data is first.data
+
+
+@pytest.mark.asyncio
+async def test_operations_touching_data_are_not_cached(monkeypatch):
+    """Only operations made entirely of meta fields are cached"""
+
+    async def no_metros():
+        return []
+
+    monkeypatch.setattr(MetroResolvers, "list_metropolitan_areas", no_metros)
+    await schema.execute("{ __typename listMetropolitanAreas { code } }")
+    await schema.execute(
+        "query Typed($name: String!) { __type(name: $name) { name } }",
+        variable_values={"name": "Gym"},
+    )
+
+    assert len(IntrospectionCache._results) == 0
@@ -0,0 +1,63 @@
+"""
+Tests for the geocoding service location cache
+"""
+
+import pytest
+from app.services.geocoding import GeocodingService
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """Geocoding service whose provider lookups are counted, not sent"""
+    service = GeocodingService(cache_size=2)
+    service.lookups = []
+
+    async def fake_search(query):
+        service.lookups.append(query)
+        if query == "nowhere":
+            return None
+        return {"latitude": 30.27, "longitude": -97.74, "city": query}
+
+    monkeypatch.setattr(service, "_search_location_uncached", fake_search)
+    return service
+
+
+@pytest.mark.asyncio
+async def test_equivalent_queries_share_one_lookup(service):
+    """Case, commas and spacing do not defeat the cache"""
+    await service.search_location("Austin, TX")
+    await service.search_location("  austin   tx ")
+
+    assert service.lookups == ["Austin, TX"]
+
+
+@pytest.mark.asyncio
+async def test_failed_lookups_are_retried(service):
+    """A None result is not cached"""
+    assert await service.search_location("nowhere") is None
+    assert await service.search_location("nowhere") is None
+
+    assert service.lookups == ["nowhere", "nowhere"]
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entry_is_evicted(service):
+    """The cache stays within cache_size"""
+    await service.search_location("Austin")
+    await service.search_location("Denver")
+    await service.search_location("Austin")
+    await service.search_location("Boston")
+    await service.search_location("Austin")
+    await service.search_location("Denver")
+
+    assert service.lookups == ["Austin", "Denver", "Boston", "Denver"]
+
+
+@pytest.mark.asyncio
+async def test_callers_cannot_mutate_cached_entry(service):
+    """Each caller gets its own copy of the cached dict"""
+    first = await service.search_location("Austin")
+    first["latitude"] = 0.0
+
+    second = await service.search_location("Austin")
+    assert second["latitude"] == 30.27
@@ -0,0 +1,47 @@
+"""
+Tests for the Google Places autocomplete cache
+"""
+
+import pytest
+from app.services import google_places
+from app.services.google_places import GooglePlacesService
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """Places service whose API lookups are counted, not sent"""
+    service = GooglePlacesService()
+    service.lookups = []
+
+    async def fake_autocomplete(input_text, country):
+        service.lookups.append(input_text)
+        if input_text == "zz":
+            return []
+        return [{"place_id": "1", "description": input_text}]
+
+    monkeypatch.setattr(service, "_autocomplete_cities_uncached", fake_autocomplete)
+    return service
+
+
+@pytest.mark.asyncio
+async def test_repeated_prefixes_share_one_lookup(service):
+    """Case and spacing variants of a prefix hit the cache"""
+    await service.autocomplete_cities("New Y")
+    await service.autocomplete_cities(" new  y")
+
+    assert service.lookups == ["New Y"]
+
+
+@pytest.mark.asyncio
+async def test_expired_and_short_inputs_are_looked_up(service, monkeypatch):
+    """Single characters skip the cache and entries expire after the TTL"""
+    await service.autocomplete_cities("n")
+    await service.autocomplete_cities("n")
+    await service.autocomplete_cities("zz")
+    await service.autocomplete_cities("zz")
+    await service.autocomplete_cities("austin")
+
+    monkeypatch.setattr(google_places.time, "monotonic", lambda: float("inf"))
+    await service.autocomplete_cities("austin")
+
+    assert service.lookups == ["n", "n", "zz", "zz", "austin", "austin"]
@@ -2,7 +2,11 @@
 Test GraphQL schema and resolvers
 """
 
+import asyncio
+
 import pytest
+from app.graphql.resolvers import GymResolvers, MetroResolvers
+from app.graphql.schema import schema
 from httpx import AsyncClient
 
 
@@ -72,3 +76,34 @@ async def test_invalid_graphql_query(async_client: AsyncClient):
     data = response.json()
     assert "errors" in data
     assert len(data["errors"]) > 0
+
+
+@pytest.mark.asyncio
+async def test_sibling_query_fields_resolve_concurrently(monkeypatch):
+    """Top-level fields in one document overlap instead of running in turn"""
+    both_started = asyncio.Event()
+    started = []
+
+    async def wait_for_sibling():
+        started.append(1)
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+
+    async def fake_metro(code):
+        await wait_for_sibling()
+        return None
+
+    async def fake_gym(gym_id):
+        await wait_for_sibling()
+        return None
+
+    monkeypatch.setattr(MetroResolvers, "metropolitan_area", fake_metro)
+    monkeypatch.setattr(GymResolvers, "gym_by_id", fake_gym)
+
+    result = await schema.execute(
+        '{ metropolitanArea(code: "austin-tx") { code } gymById(gymId: "1") { id } }'
+    )
+
+    assert result.errors is None
+    assert result.data == {"metropolitanArea": None, "gymById": None}
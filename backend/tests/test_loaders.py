@@ -0,0 +1,65 @@
+"""
+Test that nested Gym fields are batched through per-request DataLoaders
+"""
+
+from datetime import datetime
+
+import pytest
+from app.graphql.resolvers import GymResolvers
+from app.graphql.schema import (
+    Coordinates,
+    DataSource,
+    Gym,
+    GymConnection,
+    GymEdge,
+    PageInfo,
+    schema,
+)
+from strawberry.dataloader import DataLoader
+
+
+def _gym(gym_id: str) -> Gym:
+    now = datetime(2025, 1, 1)
+    return Gym(
+        id=gym_id,
+        name=f"Gym {gym_id}",
+        address="1 Main St",
+        coordinates=Coordinates(latitude=30.0, longitude=-97.0),
+        confidence=0.9,
+        match_confidence=0.9,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.mark.asyncio
+async def test_gym_sources_are_batched(monkeypatch):
+    """Sources for a list of gyms are fetched with a single batch call"""
+
+    async def fake_gyms_by_metro(*args, **kwargs):
+        return GymConnection(
+            edges=[GymEdge(cursor=i, node=_gym(i)) for i in ("a", "b", "c")],
+            page_info=PageInfo(end_cursor="c", has_next_page=False),
+        )
+
+    monkeypatch.setattr(GymResolvers, "gyms_by_metro", fake_gyms_by_metro)
+
+    batches = []
+
+    async def load_sources(gym_ids):
+        batches.append(list(gym_ids))
+        return [
+            [DataSource(name="Yelp", confidence=1.0, last_updated=datetime.utcnow())]
+            for _ in gym_ids
+        ]
+
+    result = await schema.execute(
+        '{ gymsByMetro(metroCode: "austin-tx") '
+        "{ edges { node { id sources { name } } } } }",
+        context_value={"sources_loader": DataLoader(load_fn=load_sources)},
+    )
+
+    assert result.errors is None
+    assert batches == [["a", "b", "c"]]
+    edges = result.data["gymsByMetro"]["edges"]
+    assert [e["node"]["sources"][0]["name"] for e in edges] == ["Yelp"] * 3
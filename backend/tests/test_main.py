@@ -23,3 +23,60 @@ def test_health_endpoint():
     assert response.status_code == 200
     assert response.json()["status"] == "healthy"
     assert "services" in response.json()
+    assert response.json()["google_places_calls"] == {"queued": 0, "retries": 0}
+    assert "database_pool" in response.json()
+
+
+def test_middleware_is_pure_asgi():
+    """BaseHTTPMiddleware wraps every request in extra task and stream objects"""
+    from starlette.middleware.base import BaseHTTPMiddleware
+
+    assert app.user_middleware
+    for middleware in app.user_middleware:
+        assert not issubclass(middleware.cls, BaseHTTPMiddleware)
+
+
+def test_routes_skip_response_validation():
+    """No route declares a response model FastAPI would validate against"""
+    from fastapi.routing import APIRoute
+
+    routes = [route for route in app.routes if isinstance(route, APIRoute)]
+    assert {"/", "/health"} <= {route.path for route in routes}
+    for route in routes:
+        assert route.response_field is None, route.path
+
+
+def test_health_reports_when_database_setup_finishes(monkeypatch):
+    """Startup does not wait for database setup; /health shows its progress"""
+    import time
+
+    monkeypatch.delenv("AUTO_INIT_DB", raising=False)
+    monkeypatch.delenv("SEED_DATABASE", raising=False)
+
+    with TestClient(app) as started:
+        deadline = time.monotonic() + 1
+        while not started.get("/health").json()["database_ready"]:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+
+def test_health_reports_failed_database_setup(monkeypatch):
+    """A failed setup step is reported and never marks the database ready"""
+    import time
+
+    from app import main
+
+    async def failing_init_database():
+        raise RuntimeError("no database")
+
+    monkeypatch.setattr(main, "_env_flag", lambda name: name == "AUTO_INIT_DB")
+    monkeypatch.setattr("app.db_init.init_database", failing_init_database)
+
+    with TestClient(app) as started:
+        deadline = time.monotonic() + 1
+        while not (health := started.get("/health").json())["database_error"]:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+    assert health["database_ready"] is False
+    assert "no database" in health["database_error"]
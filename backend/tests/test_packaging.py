@@ -0,0 +1,19 @@
+"""
+Guard against duplicate database modules in the app package
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+
+
+@pytest.mark.parametrize("module", ["database", "db_init"])
+def test_single_database_module(module):
+    """Only one copy exists, so only one engine and mapper registry is built"""
+    spec = importlib.util.find_spec(f"app.{module}")
+    assert spec is not None
+    assert Path(spec.origin).resolve() == APP_DIR / f"{module}.py"
+    assert list(APP_DIR.rglob(f"{module}.py")) == [APP_DIR / f"{module}.py"]
@@ -0,0 +1,53 @@
+"""
+Tests for automatic persisted queries on the GraphQL endpoint
+"""
+
+import hashlib
+import json
+
+from app.main import app, graphql_app
+from fastapi.testclient import TestClient
+
+client = TestClient(app)
+
+QUERY = "query Ping { __typename }"
+EXTENSIONS = {
+    "persistedQuery": {
+        "version": 1,
+        "sha256Hash": hashlib.sha256(QUERY.encode()).hexdigest(),
+    }
+}
+
+
+def test_hash_is_registered_then_served_alone():
+    """An unknown hash asks for the text; once sent, the hash alone works"""
+    missing = client.post("/graphql", json={"extensions": EXTENSIONS}).json()
+    assert missing["errors"][0]["message"] == "PersistedQueryNotFound"
+
+    registered = client.post(
+        "/graphql", json={"query": QUERY, "extensions": EXTENSIONS}
+    )
+    assert registered.json()["data"] == {"__typename": "Query"}
+
+    by_hash = client.get(
+        "/graphql",
+        params={"extensions": json.dumps(EXTENSIONS)},
+        headers={"Accept": "application/json"},
+    ).json()
+    assert by_hash["data"] == {"__typename": "Query"}
+
+
+def test_mismatched_hash_is_rejected():
+    """Text that does not hash to the given sha256 is refused"""
+    response = client.post(
+        "/graphql", json={"query": "{ __typename }", "extensions": EXTENSIONS}
+    )
+
+    assert response.status_code == 400
+
+
+def test_response_encoding_round_trips():
+    """Responses decode to the same payload the stdlib encoder would give"""
+    payload = {"data": {"cityAutocomplete": [{"mainText": "Montréal"}]}}
+    encoded = graphql_app.encode_json(payload)
+    assert json.loads(encoded) == payload
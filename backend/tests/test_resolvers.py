@@ -0,0 +1,403 @@
+"""
+Tests for resolver helpers that do not need a database
+"""
+
+import asyncio
+import json
+import uuid
+from datetime import datetime
+
+import pytest
+from app.graphql import resolvers
+from app.graphql.resolvers import (
+    THREADED_CONVERSION_THRESHOLD,
+    GymResolvers,
+    MetroResolvers,
+    MutationResolvers,
+)
+from app.graphql.schema import (
+    Coordinates,
+    GymDataInput,
+    SearchFilters,
+    SearchResult,
+    schema,
+)
+from app.models.gym import Gym
+
+
+def test_gym_to_graphql_maps_every_column():
+    """Each model column lands on the matching GraphQL field"""
+    gym = Gym(
+        id=uuid.uuid4(),
+        name="Iron Works",
+        address="1 Main St",
+        phone="555-0100",
+        website="https://ironworks.example",
+        instagram="@ironworks",
+        latitude=30.27,
+        longitude=-97.74,
+        confidence=0.8,
+        match_confidence=0.7,
+        rating=4.5,
+        review_count=12,
+        source_city="Austin",
+        metropolitan_area_code="austin-tx",
+        created_at=datetime(2025, 1, 1),
+        updated_at=datetime(2025, 1, 2),
+    )
+
+    result = GymResolvers._gym_to_graphql(gym)
+
+    assert result.id == str(gym.id)
+    assert (result.name, result.address) == ("Iron Works", "1 Main St")
+    assert (result.coordinates.latitude, result.coordinates.longitude) == (
+        30.27,
+        -97.74,
+    )
+    assert (result.phone, result.website, result.instagram) == (
+        "555-0100",
+        "https://ironworks.example",
+        "@ironworks",
+    )
+    assert (result.confidence, result.match_confidence) == (0.8, 0.7)
+    assert (result.rating, result.review_count) == (4.5, 12)
+    assert (result.source_city, result.metropolitan_area_code) == (
+        "Austin",
+        "austin-tx",
+    )
+    assert (result.created_at, result.updated_at) == (
+        datetime(2025, 1, 1),
+        datetime(2025, 1, 2),
+    )
+    assert not hasattr(result.coordinates, "__dict__")
+
+
+def _gyms(count: int):
+    now = datetime(2025, 1, 1)
+    return [
+        Gym(
+            id=uuid.uuid4(),
+            name=f"Gym {i}",
+            address=f"{i} Main St",
+            latitude=30.0,
+            longitude=-97.0,
+            confidence=0.5,
+            match_confidence=0.5,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("count", [3, THREADED_CONVERSION_THRESHOLD + 1])
+async def test_gyms_to_graphql_preserves_order(count):
+    """Small and threaded conversions return gyms in input order"""
+    gyms = _gyms(count)
+
+    result = await GymResolvers._gyms_to_graphql(gyms)
+
+    assert [g.id for g in result] == [str(gym.id) for gym in gyms]
+
+
+@pytest.mark.asyncio
+async def test_metro_areas_are_loaded_once_per_ttl(monkeypatch):
+    """Lookups and listings share one CLI call until the cache expires"""
+    calls = []
+
+    async def fake_get_metro_areas():
+        calls.append(1)
+        return [
+            {
+                "code": "austin-tx",
+                "name": "Austin",
+                "description": "Central Texas",
+                "state": "TX",
+                "density_category": "high",
+                "market_characteristics": ["tech"],
+                "zip_codes": ["78701"],
+            }
+        ]
+
+    monkeypatch.setattr(
+        resolvers.cli_bridge_service, "get_metro_areas", fake_get_metro_areas
+    )
+    monkeypatch.setattr(MetroResolvers, "_metro_cache", None)
+
+    austin = await MetroResolvers.metropolitan_area("austin-tx")
+    listed = await MetroResolvers.list_metropolitan_areas()
+    missing = await MetroResolvers.metropolitan_area("nowhere")
+
+    assert austin.name == "Austin"
+    assert [area.code for area in listed] == ["austin-tx"]
+    assert missing is None
+    assert len(calls) == 1
+
+    monkeypatch.setattr(resolvers.time, "monotonic", lambda: float("inf"))
+    await MetroResolvers.list_metropolitan_areas()
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_metro_lookups_share_one_reload(monkeypatch):
+    """Requests arriving while the cache is cold wait for a single reload"""
+    calls = []
+
+    async def fake_get_metro_areas():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return []
+
+    monkeypatch.setattr(
+        resolvers.cli_bridge_service, "get_metro_areas", fake_get_metro_areas
+    )
+    monkeypatch.setattr(MetroResolvers, "_metro_cache", None)
+    monkeypatch.setattr(MetroResolvers, "_metro_lock", asyncio.Lock())
+
+    await asyncio.gather(*(MetroResolvers.list_metropolitan_areas() for _ in range(5)))
+
+    assert len(calls) == 1
+
+
+def test_gym_cursor_round_trips():
+    """A cursor decodes back to the gym's keyset position"""
+    gym = _gyms(1)[0]
+
+    cursor = resolvers._encode_gym_cursor(gym)
+
+    assert resolvers._decode_gym_cursor(cursor) == (gym.created_at, gym.id)
+
+
+def test_malformed_gym_cursor_is_rejected():
+    """Garbage cursors raise ValueError instead of reaching the query"""
+    with pytest.raises(ValueError):
+        resolvers._decode_gym_cursor("not-a-cursor")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "fake_db_session", [_gyms(resolvers.MAX_METRO_PAGE_SIZE + 1)], indirect=True
+)
+async def test_gyms_by_metro_caps_page_size(fake_db_session):
+    """Oversized pages are clamped and report that more rows follow"""
+    page = await GymResolvers.gyms_by_metro("austin-tx", limit=10_000)
+
+    limits = [query._limit for query in fake_db_session.statements]
+    assert limits == [resolvers.MAX_METRO_PAGE_SIZE + 1]
+    assert len(page.edges) == resolvers.MAX_METRO_PAGE_SIZE
+    assert page.page_info.has_next_page
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "fields, include_stats",
+    [
+        ("totalResults gyms { id }", False),
+        ("totalResults yelpResults", True),
+        ("... on SearchResult { mergedCount }", True),
+    ],
+)
+async def test_search_stats_follow_selection(monkeypatch, fields, include_stats):
+    """The source-count query only runs when a count field is selected"""
+    calls = []
+
+    async def fake_search(*args, include_stats=True, **kwargs):
+        calls.append(include_stats)
+        return SearchResult(
+            location="Austin",
+            coordinates=Coordinates(latitude=30.0, longitude=-97.0),
+            radius_miles=10.0,
+            timestamp=datetime(2025, 1, 1),
+            gyms=[],
+            total_results=0,
+            yelp_results=0,
+            google_results=0,
+            merged_count=0,
+            avg_confidence=0.0,
+            execution_time_seconds=0.0,
+            use_google=True,
+        )
+
+    monkeypatch.setattr(GymResolvers, "search_gyms_by_location", fake_search)
+
+    result = await schema.execute(
+        f'{{ searchGyms(location: "Austin") {{ {fields} }} }}', context_value={}
+    )
+
+    assert result.errors is None
+    assert calls == [include_stats]
+
+
+@pytest.mark.asyncio
+async def test_max_distance_filters_on_geography_in_meters(
+    monkeypatch, fake_db_session
+):
+    """Max distance becomes an ST_DWithin on geographies, miles to meters"""
+    from sqlalchemy.dialects import postgresql
+
+    async def fake_search_location(location):
+        return {"latitude": 30.27, "longitude": -97.74}
+
+    async def fake_find_gyms_in_city(self, session, **kwargs):
+        return [{"id": str(uuid.uuid4())}]
+
+    monkeypatch.setattr(
+        resolvers.geocoding_service, "search_location", fake_search_location
+    )
+    monkeypatch.setattr(
+        resolvers.CityBoundaryService, "find_gyms_in_city", fake_find_gyms_in_city
+    )
+
+    await GymResolvers.search_gyms_by_location(
+        "Austin", filters=SearchFilters(max_distance=2.0), include_stats=False
+    )
+
+    assert len(fake_db_session.statements) == 1
+    compiled = fake_db_session.statements[0].compile(dialect=postgresql.dialect())
+    assert "ST_DWithin(geography(gyms.location), geography(" in str(compiled)
+    assert 2.0 * 1609.34 in compiled.params.values()
+
+
+@pytest.mark.asyncio
+async def test_gym_by_id_reads_gym_in_one_statement(fake_db_session):
+    """One SELECT, leaving out the geometry and raw API payload"""
+    from sqlalchemy.dialects import postgresql
+
+    assert await GymResolvers.gym_by_id(str(uuid.uuid4())) is None
+
+    assert len(fake_db_session.statements) == 1
+    sql = str(fake_db_session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "gyms.location" not in sql and "gyms.raw_data" not in sql
+
+
+def test_plain_gym_select_skips_raw_data():
+    """Seed and import lookups select Gym without the raw API payload"""
+    from sqlalchemy import select
+    from sqlalchemy.dialects import postgresql
+
+    sql = str(select(Gym).compile(dialect=postgresql.dialect()))
+    assert "gyms.name" in sql and "gyms.raw_data" not in sql
+
+
+@pytest.mark.asyncio
+async def test_gym_analytics_builds_payload_from_aggregates(monkeypatch):
+    """Aggregate rows are mapped onto the histogram and rating JSON"""
+
+    async def fake_fetch_all(query):
+        if "data_sources" in str(query):
+            return [("Yelp", 2), ("Google Places", 1)]
+        return [(3, 1, 0, 0, 1, 1, 2, 4.5, 4.0, 5.0)]
+
+    async def fake_search_location(location):
+        return {"latitude": 30.27, "longitude": -97.74}
+
+    monkeypatch.setattr(GymResolvers, "_fetch_all", fake_fetch_all)
+    monkeypatch.setattr(
+        resolvers.geocoding_service, "search_location", fake_search_location
+    )
+
+    analytics = await GymResolvers.gym_analytics("Austin")
+
+    assert analytics.total_gyms == 3
+    assert json.loads(analytics.confidence_distribution) == {
+        "0.0-0.2": 1,
+        "0.2-0.4": 0,
+        "0.4-0.6": 0,
+        "0.6-0.8": 1,
+        "0.8-1.0": 1,
+    }
+    assert json.loads(analytics.source_breakdown) == {"Yelp": 2, "Google Places": 1}
+    assert json.loads(analytics.rating_analysis) == {
+        "count": 2,
+        "average": 4.5,
+        "min": 4.0,
+        "max": 5.0,
+    }
+
+
+def test_parse_iso_timestamp_accepts_zulu_suffix():
+    """CLI timestamps ending in Z parse as UTC"""
+    parsed = resolvers._parse_iso_timestamp("2025-01-01T12:00:00Z")
+
+    assert parsed == datetime.fromisoformat("2025-01-01T12:00:00+00:00")
+    assert resolvers._parse_iso_timestamp("2025-01-01T12:00:00") == datetime(
+        2025, 1, 1, 12
+    )
+
+
+UPSERTED = [(uuid.uuid4(), True), (uuid.uuid4(), False)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fake_db_session", [UPSERTED], indirect=True)
+async def test_upsert_gyms_batches_on_name_and_address(monkeypatch, fake_db_session):
+    """Rows go out as ON CONFLICT (name, address) upserts, one per batch"""
+    from sqlalchemy.dialects import postgresql
+
+    monkeypatch.setattr(resolvers, "GYM_UPSERT_BATCH_SIZE", 2)
+    gyms = _gyms(3)
+
+    rows = [
+        dict(name=g.name, address=g.address, latitude=30.0, longitude=-97.0)
+        for g in gyms
+    ]
+    upserted = await GymResolvers._upsert_gyms(fake_db_session, rows)
+
+    assert len(fake_db_session.statements) == 2
+    assert upserted == UPSERTED * 2
+    sql = str(fake_db_session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (name, address) DO UPDATE" in sql
+    assert "rating = excluded.rating" in sql
+    assert "xmax = 0" in sql
+
+
+def test_dedupe_cli_gyms_keeps_most_confident_record():
+    """Duplicates collapse to the best record with every source kept"""
+    yelp = {"name": "Yelp", "confidence": 0.6}
+    google = {"name": "Google Places", "confidence": 0.9}
+    gyms_data = [
+        {"name": "Iron", "address": "1 Main", "confidence": 0.6, "sources": [yelp]},
+        {"name": "Other", "address": "2 Main", "confidence": 0.5},
+        {"name": "Iron", "address": "1 Main", "confidence": 0.9, "sources": [google]},
+    ]
+
+    unique = resolvers._dedupe_cli_gyms(gyms_data)
+
+    assert [(g["name"], g["confidence"]) for g in unique] == [
+        ("Iron", 0.9),
+        ("Other", 0.5),
+    ]
+    assert unique[0]["sources"] == [yelp, google]
+
+
+@pytest.mark.asyncio
+async def test_import_gym_data_keeps_most_confident_duplicate(
+    monkeypatch, fake_db_session
+):
+    """Imports collapse repeated gyms the same way CLI results do"""
+    upserted_rows = []
+
+    async def fake_upsert_gyms(session, rows):
+        upserted_rows.extend(rows)
+        return [(uuid.uuid4(), True) for _ in rows]
+
+    monkeypatch.setattr(GymResolvers, "_upsert_gyms", fake_upsert_gyms)
+    data = [
+        GymDataInput(
+            name="Iron",
+            address="1 Main",
+            latitude=30.0,
+            longitude=-97.0,
+            source="Yelp",
+            confidence=confidence,
+            raw_data="{}",
+        )
+        for confidence in (0.6, 0.9, 0.9)
+    ]
+
+    result = await MutationResolvers.import_gym_data("Austin", data)
+
+    assert [row["confidence"] for row in upserted_rows] == [0.9]
+    assert "sources" not in upserted_rows[0]
+    assert (result.gyms_imported, result.gyms_updated) == (1, 2)
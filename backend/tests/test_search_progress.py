@@ -0,0 +1,111 @@
+"""
+Tests for in-memory search progress tracking
+"""
+
+import asyncio
+
+import pytest
+from app.services import search_progress
+from app.services.search_progress import SearchProgressManager
+
+
+async def _drain(subscription):
+    """Statuses of every update the subscription can read without waiting"""
+    statuses = []
+    while True:
+        try:
+            progress = await asyncio.wait_for(subscription.get(), timeout=0.05)
+        except asyncio.TimeoutError:
+            return statuses
+        statuses.append(progress.status)
+
+
+@pytest.mark.asyncio
+async def test_rapid_updates_are_coalesced():
+    """Updates inside one window reach subscribers once, as the latest"""
+    manager = SearchProgressManager()
+    search_id = manager.create_search("Austin", 10.0)
+    subscription = await manager.subscribe(search_id)
+
+    await manager.update_progress(search_id, "geocoding", 10.0, "Geocoding")
+    await manager.update_progress(search_id, "searching", 30.0, "Searching")
+    assert manager._channels[search_id].published == 0
+
+    await asyncio.sleep(search_progress.PROGRESS_COALESCE_SECONDS * 2)
+    assert await _drain(subscription) == ["pending", "searching"]
+
+
+@pytest.mark.asyncio
+async def test_terminal_update_is_delivered_immediately():
+    """Completion skips the window and drops the superseded update"""
+    manager = SearchProgressManager()
+    search_id = manager.create_search("Austin", 10.0)
+    subscription = await manager.subscribe(search_id)
+
+    await manager.update_progress(search_id, "searching", 30.0, "Searching")
+    await manager.update_progress(search_id, "complete", 100.0, "Done")
+    await asyncio.sleep(search_progress.PROGRESS_COALESCE_SECONDS * 2)
+
+    assert await _drain(subscription) == ["pending", "complete"]
+
+
+@pytest.mark.asyncio
+async def test_one_publish_reaches_every_subscriber():
+    """Subscribers read the same update from the shared buffer"""
+    manager = SearchProgressManager()
+    search_id = manager.create_search("Austin", 10.0)
+    subscriptions = [await manager.subscribe(search_id) for _ in range(3)]
+
+    await manager.update_progress(search_id, "complete", 100.0, "Done")
+
+    for subscription in subscriptions:
+        assert await _drain(subscription) == ["pending", "complete"]
+    assert len(manager._channels[search_id].updates) == 1
+
+
+@pytest.mark.asyncio
+async def test_stalled_subscriber_is_told_it_fell_behind(monkeypatch):
+    """Overflowing the buffer yields a marker, then the oldest kept update"""
+    monkeypatch.setattr(search_progress, "PROGRESS_BUFFER_SIZE", 2)
+    manager = SearchProgressManager()
+    search_id = manager.create_search("Austin", 10.0)
+    subscription = await manager.subscribe(search_id)
+    channel = manager._channels[search_id]
+
+    for status in ("geocoding", "searching", "merging"):
+        await manager.update_progress(search_id, status, 50.0, status)
+        channel.publish(manager._pending.pop(search_id))
+
+    assert await _drain(subscription) == ["pending", "behind", "searching", "merging"]
+
+
+@pytest.mark.asyncio
+async def test_stalled_subscriber_still_gets_the_final_update(monkeypatch):
+    """The newest update is always kept, so completion is never dropped"""
+    monkeypatch.setattr(search_progress, "PROGRESS_BUFFER_SIZE", 2)
+    manager = SearchProgressManager()
+    search_id = manager.create_search("Austin", 10.0)
+    subscription = await manager.subscribe(search_id)
+    channel = manager._channels[search_id]
+
+    for status in ("geocoding", "searching", "merging"):
+        await manager.update_progress(search_id, status, 50.0, status)
+        channel.publish(manager._pending.pop(search_id))
+    await manager.update_progress(search_id, "complete", 100.0, "Done")
+
+    statuses = await _drain(subscription)
+    assert statuses[-1] == "complete" and "behind" in statuses
+
+
+@pytest.mark.asyncio
+async def test_finished_search_is_cleaned_up_after_delay(monkeypatch):
+    """Completed searches are dropped by a timer, not a sleeping task"""
+    monkeypatch.setattr(search_progress, "CLEANUP_DELAY_SECONDS", 0)
+    manager = SearchProgressManager()
+    search_id = manager.create_search("Austin", 10.0)
+
+    await manager.update_progress(search_id, "complete", 100.0, "Done")
+    assert manager.get_search_status(search_id) is not None
+
+    await asyncio.sleep(0.01)
+    assert manager.get_search_status(search_id) is None
@@ -173,9 +173,18 @@ export const MARKET_GAP_ANALYSIS = gql`
 // Get gyms by metro
 export const GET_GYMS_BY_METRO = gql`
   ${GYM_FRAGMENT}
-  query GetGymsByMetro($metroCode: String!, $limit: Int = 100, $offset: Int = 0) {
-    gymsByMetro(metroCode: $metroCode, limit: $limit, offset: $offset) {
-      ...GymFragment
+  query GetGymsByMetro($metroCode: String!, $limit: Int = 100, $after: String) {
+    gymsByMetro(metroCode: $metroCode, limit: $limit, after: $after) {
+      edges {
+        cursor
+        node {
+          ...GymFragment
+        }
+      }
+      pageInfo {
+        endCursor
+        hasNextPage
+      }
     }
   }
 `;
@@ -5,8 +5,9 @@
 
 import { ApolloClient, InMemoryCache, createHttpLink, split } from '@apollo/client';
 import { setContext } from '@apollo/client/link/context';
+import { createPersistedQueryLink } from '@apollo/client/link/persisted-queries';
 import { GraphQLWsLink } from '@apollo/client/link/subscriptions';
-import { getMainDefinition } from '@apollo/client/utilities';
+import { getMainDefinition, relayStylePagination } from '@apollo/client/utilities';
 import { createClient } from 'graphql-ws';
 
 // HTTP Link for queries and mutations
@@ -14,6 +15,18 @@ const httpLink = createHttpLink({
   uri: import.meta.env.VITE_GRAPHQL_ENDPOINT || 'http://localhost:8000/graphql',
 });
 
+// Persisted queries: send a sha256 of each document instead of its text; the
+// server asks for the full text once per document. WebCrypto is only present
+// in secure contexts, so other origins fall back to plain requests.
+const sha256 = async (query: string) => {
+  const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(query));
+  return Array.from(new Uint8Array(digest), (byte) => byte.toString(16).padStart(2, '0')).join('');
+};
+
+const queryLink = globalThis.crypto?.subtle
+  ? createPersistedQueryLink({ sha256 }).concat(httpLink)
+  : httpLink;
+
 // WebSocket Link for subscriptions
 const wsLink = new GraphQLWsLink(
   createClient({
@@ -44,7 +57,7 @@ const splitLink = split(
     );
   },
   wsLink,
-  authLink.concat(httpLink),
+  authLink.concat(queryLink),
 );
 
 // Apollo Client instance
@@ -60,12 +73,7 @@ export const apolloClient = new ApolloClient({
               return incoming;
             },
           },
-          gymsByMetro: {
-            keyArgs: ['metro_code'],
-            merge(existing = [], incoming) {
-              return [...existing, ...incoming];
-            },
-          },
+          gymsByMetro: relayStylePagination(['metroCode']),
         },
       },
       Gym: {
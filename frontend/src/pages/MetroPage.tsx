@@ -43,7 +43,8 @@ export const MetroPage = () => {
 
   const metroAreas = metroListData?.listMetropolitanAreas || [];
   const currentMetro = metroData?.metropolitanArea;
-  const gyms = gymsData?.gymsByMetro || [];
+  const gyms: Gym[] =
+    gymsData?.gymsByMetro?.edges.map((edge: { node: Gym }) => edge.node) || [];
 
   const getDensityColor = (category: string) => {
     switch (category.toLowerCase()) {